@@ -58,6 +58,6 @@ def ben_graham_agent(state: AgentState, agent_id: str = "ben_graham"):
     
     if "insights" not in state["data"]:
         state["data"]["insights"] = []
-    state["data"]["insights"].extend([i.model_dump() for i in insights])
+    state["data"]["insights"].extend([i.to_dict() for i in insights])
     
     return {"messages": [HumanMessage(content=json.dumps(state["data"]["analyst_signals"].get("ben_graham", {})), name="ben_graham")], "data": state["data"]}
@@ -56,6 +56,6 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger"):
     
     if "insights" not in state["data"]:
         state["data"]["insights"] = []
-    state["data"]["insights"].extend([i.model_dump() for i in insights])
+    state["data"]["insights"].extend([i.to_dict() for i in insights])
     
     return {"messages": [HumanMessage(content="Analysis complete", name="charlie_munger")], "data": state["data"]}
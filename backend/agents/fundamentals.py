@@ -37,6 +37,6 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
     
     if "insights" not in state["data"]:
         state["data"]["insights"] = []
-    state["data"]["insights"].extend([i.model_dump() for i in insights])
+    state["data"]["insights"].extend([i.to_dict() for i in insights])
     
     return {"messages": [HumanMessage(content="Fundamental analysis complete", name="fundamentals_analyst")], "data": state["data"]}
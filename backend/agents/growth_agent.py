@@ -26,6 +26,6 @@ def growth_analyst_agent(state: AgentState, agent_id: str = "growth_analyst"):
     
     if "insights" not in state["data"]:
         state["data"]["insights"] = []
-    state["data"]["insights"].extend([i.model_dump() for i in insights])
+    state["data"]["insights"].extend([i.to_dict() for i in insights])
     
     return {"messages": [HumanMessage(content="Growth analysis complete", name="growth_analyst")], "data": state["data"]}
\ No newline at end of file
@@ -56,6 +56,6 @@ def mohnish_pabrai_agent(state: AgentState, agent_id: str = "mohnish_pabrai"):
     
     if "insights" not in state["data"]:
         state["data"]["insights"] = []
-    state["data"]["insights"].extend([i.model_dump() for i in insights])
+    state["data"]["insights"].extend([i.to_dict() for i in insights])
     
     return {"messages": [HumanMessage(content="Analysis complete", name="mohnish_pabrai")], "data": state["data"]}
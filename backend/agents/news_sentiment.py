@@ -38,6 +38,6 @@ def news_sentiment_agent(state: AgentState, agent_id: str = "news_sentiment_anal
     
     if "insights" not in state["data"]:
         state["data"]["insights"] = []
-    state["data"]["insights"].extend([i.model_dump() for i in insights])
+    state["data"]["insights"].extend([i.to_dict() for i in insights])
     
     return {"messages": [HumanMessage(content="News analysis complete", name="news_sentiment_analyst")], "data": state["data"]}
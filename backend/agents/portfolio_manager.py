@@ -27,7 +27,7 @@ def portfolio_management_agent(state: AgentState, agent_id: str = "portfolio_man
     
     # 2. Rehydrate Insights
     insights_data = data.get("insights", [])
-    active_insights = [Insight(**i) for i in insights_data]
+    active_insights = [Insight.from_dict(i) for i in insights_data]
     
     progress.update_status(agent_id, None, "Optimizing Weights (MVO)")
     
@@ -36,7 +36,7 @@ def portfolio_management_agent(state: AgentState, agent_id: str = "portfolio_man
     targets = pcm.create_targets(active_insights, context)
     
     # Store targets for Risk Management
-    data["portfolio_targets"] = [t.model_dump() for t in targets]
+    data["portfolio_targets"] = [t.to_dict() for t in targets]
     
     # 4. Preliminary decisions for UI (State-aware)
     execution_planner = ExecutionPlanner()
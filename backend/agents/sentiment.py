@@ -22,6 +22,6 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
     
     if "insights" not in state["data"]:
         state["data"]["insights"] = []
-    state["data"]["insights"].extend([i.model_dump() for i in insights])
+    state["data"]["insights"].extend([i.to_dict() for i in insights])
     
     return {"messages": [HumanMessage(content="Sentiment analysis complete", name="sentiment_analyst")], "data": state["data"]}
\ No newline at end of file
@@ -38,6 +38,6 @@ def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analys
     
     if "insights" not in state["data"]:
         state["data"]["insights"] = []
-    state["data"]["insights"].extend([i.model_dump() for i in insights])
+    state["data"]["insights"].extend([i.to_dict() for i in insights])
     
     return {"messages": [HumanMessage(content="Technical analysis complete", name="technical_analyst")], "data": state["data"]}
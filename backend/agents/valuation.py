@@ -24,6 +24,6 @@ def valuation_analyst_agent(state: AgentState, agent_id: str = "valuation_analys
     
     if "insights" not in state["data"]:
         state["data"]["insights"] = []
-    state["data"]["insights"].extend([i.model_dump() for i in insights])
+    state["data"]["insights"].extend([i.to_dict() for i in insights])
     
     return {"messages": [HumanMessage(content="Valuation complete", name="valuation_analyst")], "data": state["data"]}
\ No newline at end of file
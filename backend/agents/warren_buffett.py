@@ -57,6 +57,6 @@ def warren_buffett_agent(state: AgentState, agent_id: str = "warren_buffett"):
     
     if "insights" not in state["data"]:
         state["data"]["insights"] = []
-    state["data"]["insights"].extend([i.model_dump() for i in insights])
+    state["data"]["insights"].extend([i.to_dict() for i in insights])
     
     return {"messages": [HumanMessage(content=json.dumps(state["data"]["analyst_signals"].get("warren_buffett", {})), name="warren_buffett")], "data": state["data"]}
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""add_cycle_performance_summary
+
+Revision ID: 4c7d2e8f1a9b
+Revises: d5e78f9a1b2c
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c7d2e8f1a9b"
+down_revision: Union[str, None] = "d5e78f9a1b2c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The app runs create_all at startup, so the table may already exist
+    inspector = sa.inspect(op.get_bind())
+    if "cycle_performance_summary" not in inspector.get_table_names():
+        op.create_table(
+            "cycle_performance_summary",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("cycle_id", sa.Integer(), nullable=False),
+            sa.Column("flow_run_id", sa.Integer(), nullable=False),
+            sa.Column("cycle_number", sa.Integer(), nullable=False),
+            sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("pnl", sa.Numeric(18, 4), nullable=True),
+            sa.Column("sharpe", sa.Float(), nullable=True),
+            sa.Column("gross_exposure", sa.Float(), nullable=True),
+            sa.Column("net_exposure", sa.Float(), nullable=True),
+            sa.Column("cash", sa.Numeric(18, 4), nullable=True),
+            sa.Column("equity", sa.Numeric(18, 4), nullable=True),
+            sa.Column("positions_count", sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(["cycle_id"], ["hedge_fund_flow_run_cycles.id"]),
+            sa.ForeignKeyConstraint(["flow_run_id"], ["hedge_fund_flow_runs.id"]),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("cycle_id"),
+        )
+        op.create_index(op.f("ix_cycle_performance_summary_id"), "cycle_performance_summary", ["id"], unique=False)
+        op.create_index("ix_cycle_performance_summary_run_cycle", "cycle_performance_summary", ["flow_run_id", "cycle_number"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_cycle_performance_summary_run_cycle", table_name="cycle_performance_summary")
+    op.drop_index(op.f("ix_cycle_performance_summary_id"), table_name="cycle_performance_summary")
+    op.drop_table("cycle_performance_summary")
@@ -0,0 +1,60 @@
+"""jsonb_hot_columns
+
+Revision ID: 6e2a9c4b7d10
+Revises: 4c7d2e8f1a9b
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6e2a9c4b7d10"
+down_revision: Union[str, None] = "4c7d2e8f1a9b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSONB_COLUMNS = {
+    "hedge_fund_flows": ["nodes", "edges", "data"],
+    "hedge_fund_flow_runs": ["request_data"],
+    "hedge_fund_flow_run_cycles": ["analyst_signals", "trading_decisions"],
+    "screener_runs": ["ranking_data"],
+    "trades": ["persona_rationale"],
+}
+
+GIN_INDEXES = {
+    "idx_cycle_signals_gin": ("hedge_fund_flow_run_cycles", "analyst_signals"),
+    "idx_screener_ranking_gin": ("screener_runs", "ranking_data"),
+    "idx_trade_rationale_gin": ("trades", "persona_rationale"),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # JSONB and GIN only exist on PostgreSQL; SQLite keeps its TEXT-backed JSON
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+
+    with op.get_context().autocommit_block():
+        for name, (table, column) in GIN_INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} USING GIN ({column} jsonb_path_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for name in GIN_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json")
@@ -0,0 +1,49 @@
+"""screener_top_k_view
+
+Revision ID: 8b3f5d1e2c47
+Revises: 6e2a9c4b7d10
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b3f5d1e2c47"
+down_revision: Union[str, None] = "6e2a9c4b7d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Materialized views are PostgreSQL-only; other dialects read screener_runs directly
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW screener_top_k AS
+        SELECT
+            r.id AS run_id,
+            r.market,
+            r.created_at,
+            t.symbol,
+            t.rank::int AS rank,
+            (r.ranking_data -> 'scores_table' -> t.symbol ->> 'composite_score')::double precision AS score,
+            r.ranking_data -> 'scores_table' -> t.symbol AS factors
+        FROM screener_runs r
+        CROSS JOIN LATERAL jsonb_array_elements_text(r.ranking_data -> 'top_k_symbols') WITH ORDINALITY AS t(symbol, rank)
+        """
+    )
+    # Unique index is required for REFRESH ... CONCURRENTLY
+    op.execute("CREATE UNIQUE INDEX ix_screener_top_k_market_created_rank ON screener_top_k (market, created_at DESC, run_id, rank)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS screener_top_k")
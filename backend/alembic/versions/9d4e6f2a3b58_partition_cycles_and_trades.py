@@ -0,0 +1,121 @@
+"""partition_cycles_and_trades
+
+Revision ID: 9d4e6f2a3b58
+Revises: 8b3f5d1e2c47
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4e6f2a3b58"
+down_revision: Union[str, None] = "8b3f5d1e2c47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Table -> secondary indexes rebuilt on the partitioned parent (inherited by each partition)
+PARTITIONED_TABLES = {
+    "hedge_fund_flow_run_cycles": ["id", "flow_run_id"],
+    "trades": ["id", "flow_run_id", "ticker", "status", "brokerage_order_id"],
+}
+
+# LIKE copies neither indexes nor foreign keys, so these are recreated on the new table
+GIN_INDEXES = {
+    "hedge_fund_flow_run_cycles": ("idx_cycle_signals_gin", "analyst_signals"),
+    "trades": ("idx_trade_rationale_gin", "persona_rationale"),
+}
+
+FOREIGN_KEYS = {
+    "hedge_fund_flow_run_cycles": ("flow_run_id", "hedge_fund_flow_runs"),
+    "trades": ("flow_run_id", "hedge_fund_flow_runs"),
+}
+
+MONTHS_AHEAD = 3
+
+# Monthly partitions kept ahead of now(); called again at app startup to roll forward
+CREATE_PARTITIONS_FN = """
+CREATE OR REPLACE FUNCTION create_monthly_partitions(parent text, start_month date, months int)
+RETURNS void AS $$
+DECLARE
+    m date;
+BEGIN
+    FOR i IN 0..months LOOP
+        m := (date_trunc('month', start_month) + make_interval(months => i))::date;
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_' || to_char(m, 'YYYY_MM'), parent, m, (m + interval '1 month')::date
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def _swap_table(table: str, indexes: list, partitioned: bool) -> None:
+    old = f"{table}_old"
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    for column in indexes:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_{column}")
+
+    if partitioned:
+        op.execute(f"UPDATE {old} SET created_at = now() WHERE created_at IS NULL")
+        op.execute(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) PARTITION BY RANGE (created_at)")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at SET NOT NULL")
+        # The partition key has to be part of the primary key
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, created_at)")
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+        first: date = op.get_bind().execute(sa.text(f"SELECT COALESCE(min(created_at), now())::date FROM {old}")).scalar()
+        today = date.today()
+        months = (today.year - first.year) * 12 + (today.month - first.month) + MONTHS_AHEAD
+        op.execute(f"SELECT create_monthly_partitions('{table}', '{first.isoformat()}', {months})")
+    else:
+        op.execute(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    # No CASCADE: anything still depending on the old table should fail the migration
+    op.execute(f"DROP TABLE {old}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    for column in indexes:
+        op.execute(f"CREATE INDEX ix_{table}_{column} ON {table} ({column})")
+
+    gin_name, gin_column = GIN_INDEXES[table]
+    op.execute(f"CREATE INDEX {gin_name} ON {table} USING GIN ({gin_column} jsonb_path_ops)")
+    fk_column, referent = FOREIGN_KEYS[table]
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_{fk_column}_fkey FOREIGN KEY ({fk_column}) REFERENCES {referent} (id)")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Declarative partitioning is PostgreSQL-only; SQLite keeps plain tables
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(CREATE_PARTITIONS_FN)
+    # A foreign key into a partitioned table must cover the partition key, so the summary
+    # table keeps cycle_id as a plain (unique) column
+    op.execute("ALTER TABLE cycle_performance_summary DROP CONSTRAINT IF EXISTS cycle_performance_summary_cycle_id_fkey")
+    for table, indexes in PARTITIONED_TABLES.items():
+        _swap_table(table, indexes, partitioned=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, indexes in PARTITIONED_TABLES.items():
+        _swap_table(table, indexes, partitioned=False)
+    op.execute(
+        "ALTER TABLE cycle_performance_summary ADD CONSTRAINT cycle_performance_summary_cycle_id_fkey "
+        "FOREIGN KEY (cycle_id) REFERENCES hedge_fund_flow_run_cycles (id)"
+    )
+    op.execute("DROP FUNCTION IF EXISTS create_monthly_partitions(text, date, int)")
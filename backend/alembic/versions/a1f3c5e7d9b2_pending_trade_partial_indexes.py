@@ -0,0 +1,52 @@
+"""pending_trade_partial_indexes
+
+Revision ID: a1f3c5e7d9b2
+Revises: 9d4e6f2a3b58
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a1f3c5e7d9b2"
+down_revision: Union[str, None] = "9d4e6f2a3b58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# index name -> (table, pending status)
+PENDING_INDEXES = {
+    "idx_trades_pending": ("trades", "PENDING_APPROVAL"),
+    "idx_proposed_trades_pending": ("proposed_trades", "PENDING"),
+}
+INCLUDE_COLUMNS = ["ticker", "action", "quantity", "flow_run_id"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for name, (table, status) in PENDING_INDEXES.items():
+        if name in {ix["name"] for ix in inspector.get_indexes(table)}:
+            continue
+        where = sa.text(f"status = '{status}'")
+        if bind.dialect.name == "postgresql":
+            # CONCURRENTLY is not supported on partitioned parents (trades after 9d4e6f2a3b58)
+            concurrently = inspector.get_pk_constraint(table)["constrained_columns"] != ["id", "created_at"]
+            with op.get_context().autocommit_block():
+                op.create_index(
+                    name, table, ["created_at"], postgresql_where=where, postgresql_include=INCLUDE_COLUMNS, postgresql_concurrently=concurrently
+                )
+        else:
+            op.create_index(name, table, ["created_at"], sqlite_where=where)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, (table, _) in PENDING_INDEXES.items():
+        op.drop_index(name, table_name=table)
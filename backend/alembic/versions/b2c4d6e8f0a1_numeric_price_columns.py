@@ -0,0 +1,58 @@
+"""numeric_price_columns
+
+Revision ID: b2c4d6e8f0a1
+Revises: a1f3c5e7d9b2
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2c4d6e8f0a1"
+down_revision: Union[str, None] = "a1f3c5e7d9b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NUMERIC_COLUMNS = {
+    "trades": ["limit_price", "risk_score", "execution_price"],
+    "hedge_fund_flow_run_cycles": ["estimated_cost"],
+}
+
+
+def _convert(to_numeric: bool) -> None:
+    bind = op.get_bind()
+    existing_tables = set(sa.inspect(bind).get_table_names())
+    new_type = sa.Numeric(18, 4) if to_numeric else sa.String(length=20)
+    old_type = sa.String(length=20) if to_numeric else sa.Numeric(18, 4)
+
+    for table, columns in NUMERIC_COLUMNS.items():
+        if table not in existing_tables:
+            continue
+        if to_numeric:
+            # str(None) used to be written for unfilled prices
+            for column in columns:
+                op.execute(f"UPDATE {table} SET {column} = NULL WHERE {column} IN ('None', '')")
+
+        if bind.dialect.name == "postgresql":
+            cast = "numeric(18,4)" if to_numeric else "varchar(20)"
+            for column in columns:
+                op.alter_column(table, column, type_=new_type, existing_type=old_type, postgresql_using=f"{column}::{cast}")
+        else:
+            with op.batch_alter_table(table) as batch_op:
+                for column in columns:
+                    batch_op.alter_column(column, type_=new_type, existing_type=old_type)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _convert(to_numeric=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _convert(to_numeric=False)
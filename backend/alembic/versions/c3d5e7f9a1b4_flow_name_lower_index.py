@@ -0,0 +1,34 @@
+"""flow_name_lower_index
+
+Revision ID: c3d5e7f9a1b4
+Revises: b2c4d6e8f0a1
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d5e7f9a1b4"
+down_revision: Union[str, None] = "b2c4d6e8f0a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The model declares this index, so create_all at startup may have built it already
+    inspector = sa.inspect(op.get_bind())
+    if "ix_flow_name_lower" in {ix["name"] for ix in inspector.get_indexes("hedge_fund_flows")}:
+        return
+
+    # Expression index; supported by both PostgreSQL and SQLite
+    op.create_index("ix_flow_name_lower", "hedge_fund_flows", [sa.text("lower(name)")])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_flow_name_lower", table_name="hedge_fund_flows")
@@ -44,7 +44,7 @@ def extract_base_agent_key(unique_id: str) -> str:
 
 @router.post("/screener/run")
 async def run_screener_api(market: str = "US", k: int = 50, config: Optional[EligibilityConfig] = None):
-    return run_screener(market=market, k=k, config=config)
+    return run_screener(market=market, k=k, config=config, background=True)
 
 
 @router.get("/stream/{ticker}")
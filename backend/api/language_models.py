@@ -21,12 +21,9 @@ ollama_service = OllamaService()
 async def get_language_models():
     """Get the list of available cloud-based and Ollama language models."""
     try:
-        # Start with cloud models
-        models = get_models_list()
-
-        # Add available Ollama models (handles all checking internally)
+        # Cloud models plus available Ollama models (handles all checking internally)
         ollama_models = await ollama_service.get_available_models()
-        models.extend(ollama_models)
+        models = [*get_models_list(), *ollama_models]
 
         return {"models": models}
     except Exception as e:
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from datetime import datetime, UTC
 from typing import Any, Dict, List, Optional, cast
@@ -5,66 +6,132 @@ from typing import Any, Dict, List, Optional, cast
 import numpy as np
 import pandas as pd
 
-from data.universe import UniverseSelectionModel
 from lean_bridge.context import AlgorithmContext
-from tools.api import (
-    get_financial_metrics,
-    get_market_cap,
-    get_price_data,
-    search_line_items,
-)
 from utils.progress import progress
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the plain Python loop
+    njit = None
 
-def calculate_rsi(prices: pd.Series, period: int = 14) -> float:
-    delta = prices.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    if rs.empty or rs.iloc[-1] == -1:
-        return 50.0
-    return float(100 - (100 / (1 + rs.iloc[-1])))
+
+def _wilder_rma_py(x: np.ndarray, period: int) -> float:
+    """Final value of Wilder's RMA, primed with the SMA of the first `period` values."""
+    avg = float(x[:period].mean())
+    for v in x[period:].tolist():
+        avg = (avg * (period - 1) + v) / period
+    return avg
 
 
-def calculate_beta(stock_returns: pd.Series, market_returns: pd.Series) -> float:
-    if len(stock_returns) < 30:
-        return 1.0
-    common_idx = stock_returns.index.intersection(market_returns.index)
-    if len(common_idx) < 30:
-        return 1.0
-    s = stock_returns.loc[common_idx]
-    m = market_returns.loc[common_idx]
-    covariance = np.cov(s, m)[0][1]
-    variance = np.var(m)
-    return float(covariance / variance) if variance != 0 else 1.0
+def _wilder_rma_loop(x: np.ndarray, period: int) -> float:
+    # Same recurrence as _wilder_rma_py, written index-wise so numba can compile it
+    avg = 0.0
+    for i in range(period):
+        avg += x[i]
+    avg /= period
+    for i in range(period, x.shape[0]):
+        avg = (avg * (period - 1) + x[i]) / period
+    return avg
 
 
-def calculate_max_drawdown(prices: pd.Series) -> float:
-    rolling_max = prices.cummax()
-    drawdown = (prices - rolling_max) / rolling_max
-    return float(drawdown.min())
+if njit is not None:
+    _wilder_rma = njit(cache=True, fastmath=True)(_wilder_rma_loop)
+    # Compile once at import so the first analysed ticker doesn't pay the JIT cost
+    _wilder_rma(np.zeros(16, dtype=np.float32), 14)
+else:
+    _wilder_rma = _wilder_rma_py
 
 
-def calculate_var(returns: pd.Series, confidence_level: float = 0.05) -> float:
-    if len(returns) == 0:
-        return 0.0
-    return float(np.percentile(returns, confidence_level * 100))
+def calculate_rsi(prices: np.ndarray, period: int = 14) -> float:
+    """Wilder RSI: gains/losses smoothed with an RMA (alpha = 1/period), as on TradingView."""
+    delta = np.diff(prices)
+    delta = delta[np.isfinite(delta)]
+    if len(delta) < period:
+        return 50.0
+    avg_gain = _wilder_rma(np.clip(delta, 0, None), period)
+    avg_loss = _wilder_rma(np.clip(-delta, 0, None), period)
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else 50.0
+    rs = avg_gain / avg_loss
+    return float(100 - (100 / (1 + rs)))
+
+
+def calculate_price_metrics(prices_wide: pd.DataFrame) -> pd.DataFrame:
+    """
+    Computes the price-based factors for every ticker at once.
+    Input is wide (index = date, columns = tickers); output is indexed by ticker.
+    """
+    prices = prices_wide.astype(np.float32)
+    arr = prices.to_numpy()
+    valid = ~np.isnan(arr)
+    counts = valid.sum(axis=0)
+
+    # Only a handful of rows are needed, so index them directly rather than rolling the whole frame
+    mom_12m_1m = np.zeros(arr.shape[1], dtype=np.float32)
+    if len(arr) > 252:
+        mom_12m_1m = np.where(counts > 252, arr[-21] / arr[-252] - 1, 0.0)
+
+    last_idx = len(arr) - 1 - valid[::-1].argmax(axis=0)
+    last = arr[last_idx, np.arange(arr.shape[1])]
+    tail = arr[-200:]
+    ma_200 = np.nansum(tail, axis=0) / (~np.isnan(tail)).sum(axis=0)
+    dist_200ma = last / ma_200 - 1
+
+    rolling_max = np.fmax.accumulate(arr, axis=0)
+    max_dd = np.nanmin((arr - rolling_max) / rolling_max, axis=0)
+
+    # No padding: gaps stay NaN instead of yielding zero returns, as in the per-ticker version
+    returns = prices.pct_change(fill_method=None)
+    var_95 = returns.quantile(0.05)
+
+    rsi = [calculate_rsi(arr[:, j]) if counts[j] > 14 else 50.0 for j in range(arr.shape[1])]
+
+    return pd.DataFrame({
+        "momentum_12m_1m": mom_12m_1m,
+        "rsi": rsi,
+        "dist_200ma": dist_200ma,
+        "max_drawdown": max_dd,
+        "var_95": var_95,
+    }, index=prices.columns).astype(np.float64).fillna(0.0)
+
+
+def _to_calendar_dates(close: pd.Series) -> pd.Series:
+    """Re-indexes a close series on naive calendar dates so tz-aware (Alpaca) and naive (Alpha Vantage) sources align."""
+    idx = pd.DatetimeIndex(close.index)
+    if idx.tz is not None:
+        idx = idx.tz_convert(None)
+    close = close.set_axis(idx.normalize())
+    return close[~close.index.duplicated(keep="last")]
 
 
 class QuantEngine:
-    def __init__(self, tickers: List[str], start_date: str, end_date: str):
+    def __init__(self, tickers: List[str], start_date: str, end_date: str, max_concurrency: int = 8):
         self.tickers = tickers
         self.start_date = start_date
         self.end_date = end_date
+        self.max_concurrency = max_concurrency
         self.results = {}
 
     def run(self) -> Dict[str, Any]:
+        return asyncio.run(self._run_async())
+
+    async def _run_async(self) -> Dict[str, Any]:
+        from scipy.stats import zscore
+
         raw_data = []
+        # Bounds in-flight data requests to respect provider rate limits
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # 1. Fetch Prices & Calculate Price Factors across the whole universe
+        prices_wide = await self._get_prices_wide(semaphore)
+        if prices_wide.empty:
+            return {}
+        price_metrics = calculate_price_metrics(prices_wide).to_dict(orient="index")
 
-        # 1. Fetch Data & Calculate Raw Metrics
-        for ticker in self.tickers:
-            progress.update_status("quant_engine", ticker, "Calculating Institutional Factors")
-            metrics = self._calculate_ticker_metrics(ticker)
+        # 2. Fetch Fundamentals & Calculate Raw Metrics
+        tickers = list(prices_wide.columns)
+        all_metrics = await asyncio.gather(*[self._calculate_ticker_metrics(ticker, price_metrics[ticker], semaphore) for ticker in tickers])
+        for ticker, metrics in zip(tickers, all_metrics):
             if metrics:
                 metrics_data: Dict[str, Any] = cast(Dict[str, Any], metrics)
                 metrics_data["ticker"] = ticker
@@ -75,25 +142,23 @@ class QuantEngine:
 
         df = pd.DataFrame(raw_data)
 
-        # 2. Z-Score Normalization
+        # 3. Z-Score Normalization
+        # One column-wise kernel over the numeric block; zero-std columns come back NaN -> 0.0
         numeric_cols = df.select_dtypes(include=[np.number]).columns
-        z_score_df = df.copy()
-        for col in numeric_cols:
-            if df[col].std() != 0:
-                z_score_df[f"{col}_z"] = (df[col] - df[col].mean()) / df[col].std()
-            else:
-                z_score_df[f"{col}_z"] = 0.0
-
-        # 3. Structure Output
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = zscore(df[numeric_cols].to_numpy(dtype=np.float64), axis=0, ddof=1, nan_policy="omit")
+        z_score_df = pd.DataFrame(np.nan_to_num(z, nan=0.0), index=df.index, columns=[f"{c}_z" for c in numeric_cols])
+
+        # 4. Structure Output (tickers are unique, so index them once instead of scanning per row)
+        metrics_by_ticker = df.set_index("ticker").to_dict(orient="index")
+        z_by_ticker = z_score_df.set_axis(df["ticker"]).to_dict(orient="index")
+
         final_scorecard = {}
-        for _, row in z_score_df.iterrows():
-            ticker = str(row["ticker"])
-            orig_row = df[df["ticker"] == ticker].iloc[0]
-            
-            metrics_dict = {str(k): float(v) if pd.notnull(v) else 0.0 for k, v in orig_row.items() if str(k) != "ticker"}
-            z_scores_dict = {str(k): float(v) if pd.notnull(v) else 0.0 for k, v in row.items() if str(k).endswith("_z")}
-            
-            final_scorecard[ticker] = {
+        for ticker, orig_row in metrics_by_ticker.items():
+            metrics_dict = {str(k): float(v) if pd.notnull(v) else 0.0 for k, v in orig_row.items()}
+            z_scores_dict = {str(k): float(v) if pd.notnull(v) else 0.0 for k, v in z_by_ticker[ticker].items()}
+
+            final_scorecard[str(ticker)] = {
                 "metrics": metrics_dict,
                 "z_scores": z_scores_dict
             }
@@ -101,37 +166,46 @@ class QuantEngine:
         progress.update_status("quant_engine", None, "Done")
         return final_scorecard
 
-    def _calculate_ticker_metrics(self, ticker: str) -> Optional[Dict[str, float]]:
+    async def _get_prices_wide(self, semaphore: asyncio.Semaphore) -> pd.DataFrame:
+        """Fetches close prices for every ticker into one date-aligned wide frame."""
+        from tools.api import get_price_data
+
+        async def fetch(ticker: str) -> Optional[pd.Series]:
+            async with semaphore:
+                progress.update_status("quant_engine", ticker, "Fetching price history")
+                try:
+                    prices_df = await asyncio.to_thread(get_price_data, ticker, self.start_date, self.end_date)
+                except Exception as e:
+                    print(f"Error fetching prices for {ticker}: {e}")
+                    return None
+            return None if prices_df.empty else _to_calendar_dates(prices_df["close"])
+
+        results = await asyncio.gather(*[fetch(ticker) for ticker in self.tickers])
+        closes = {ticker: close for ticker, close in zip(self.tickers, results) if close is not None}
+        if not closes:
+            return pd.DataFrame()
+        return pd.DataFrame(closes).sort_index()
+
+    async def _calculate_ticker_metrics(self, ticker: str, price_metrics: Dict[str, float], semaphore: asyncio.Semaphore) -> Optional[Dict[str, float]]:
+        from tools.api import get_financial_metrics, get_market_cap, search_line_items
+
         try:
-            prices_df = get_price_data(ticker, self.start_date, self.end_date)
-            if prices_df.empty:
-                return None
-
-            financials = get_financial_metrics(ticker, self.end_date, limit=1)
-            line_items = search_line_items(ticker, [
-                "revenue", "total_assets", "total_current_assets", 
-                "total_current_liabilities", "retained_earnings", "ebit", 
-                "total_liabilities"
-            ], self.end_date, limit=1)
-            market_cap = get_market_cap(ticker, self.end_date)
+            async with semaphore:
+                progress.update_status("quant_engine", ticker, "Calculating Institutional Factors")
+                # The three fundamentals requests are independent, so overlap them
+                financials, line_items, market_cap = await asyncio.gather(
+                    asyncio.to_thread(get_financial_metrics, ticker, self.end_date, limit=1),
+                    asyncio.to_thread(search_line_items, ticker, [
+                        "revenue", "total_assets", "total_current_assets", 
+                        "total_current_liabilities", "retained_earnings", "ebit", 
+                        "total_liabilities"
+                    ], self.end_date, limit=1),
+                    asyncio.to_thread(get_market_cap, ticker, self.end_date),
+                )
 
             latest_fin = financials[0] if financials else None
             latest_line = line_items[0] if line_items else None
 
-            prices = prices_df["close"]
-            returns = prices.pct_change().dropna()
-            
-            mom_12m_1m = 0.0
-            if len(prices) > 252:
-                mom_12m_1m = float((prices.iloc[-21] / prices.iloc[-252]) - 1)
-
-            rsi = calculate_rsi(prices) if len(prices) > 14 else 50.0
-            ma_200 = prices.rolling(window=200).mean().iloc[-1] if len(prices) >= 200 else prices.mean()
-            dist_200ma = float((prices.iloc[-1] / ma_200) - 1)
-
-            max_dd = calculate_max_drawdown(prices)
-            var_95 = calculate_var(returns)
-
             pe = getattr(latest_fin, "price_to_earnings_ratio", 0.0) or 0.0
             pb = getattr(latest_fin, "price_to_book_ratio", 0.0) or 0.0
             ev_ebitda = getattr(latest_fin, "enterprise_value_to_ebitda_ratio", 0.0) or 0.0
@@ -164,11 +238,11 @@ class QuantEngine:
             eps_growth = getattr(latest_fin, "earnings_growth", 0.0) or 0.0
 
             return {
-                "momentum_12m_1m": float(mom_12m_1m),
-                "rsi": float(rsi),
-                "dist_200ma": float(dist_200ma),
-                "max_drawdown": float(max_dd),
-                "var_95": float(var_95),
+                "momentum_12m_1m": float(price_metrics["momentum_12m_1m"]),
+                "rsi": float(price_metrics["rsi"]),
+                "dist_200ma": float(price_metrics["dist_200ma"]),
+                "max_drawdown": float(price_metrics["max_drawdown"]),
+                "var_95": float(price_metrics["var_95"]),
                 "pe_ratio": float(pe),
                 "pb_ratio": float(pb),
                 "ev_ebitda": float(ev_ebitda),
@@ -188,6 +262,8 @@ class QuantEngine:
 
 def universe_selection_node(state: Dict[str, Any]):
     """Fast node to determine active tickers."""
+    from data.universe import UniverseSelectionModel
+
     data = state["data"]
     usm_data = {
         "market": data.get("market") or data.get("portfolio", {}).get("market"),
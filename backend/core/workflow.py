@@ -7,6 +7,15 @@ from core.quant_engine import universe_selection_node, factor_calculation_node
 from graph.state import AgentState
 from utils.analysts import get_analyst_nodes
 
+# Built once at import; the analyst registry is static for the process lifetime.
+_ANALYST_NODES = get_analyst_nodes()
+
+# We split agents into 'Data/Sentiment Analysts' and 'Strategy Personas'
+ANALYTICAL_KEYS = frozenset({
+    "technical_analyst", "fundamentals_analyst", "sentiment_analyst",
+    "growth_analyst", "valuation_analyst", "news_sentiment_analyst"
+})
+
 
 def start(state: AgentState):
     return state
@@ -26,16 +35,9 @@ def create_investment_committee_workflow(selected_analysts=None):
     workflow.add_edge("start_node", "discovery")
 
     # analysts nodes
-    analyst_nodes = get_analyst_nodes()
     if selected_analysts is None:
-        selected_analysts = list(analyst_nodes.keys())
-
-    # We split agents into 'Data/Sentiment Analysts' and 'Strategy Personas'
-    analytical_keys = {
-        "technical_analyst", "fundamentals_analyst", "sentiment_analyst", 
-        "growth_analyst", "valuation_analyst", "news_sentiment_analyst"
-    }
-    
+        selected_analysts = list(_ANALYST_NODES.keys())
+
     # 2. PARALLEL DATA PHASE
     # These agents and the Quant Engine run as soon as tickers are found.
     # They provide the 'facts' for the personas.
@@ -46,8 +48,8 @@ def create_investment_committee_workflow(selected_analysts=None):
     selected_personas = []
 
     for key in selected_analysts:
-        node_name, node_func = analyst_nodes[key]
-        if key in analytical_keys:
+        node_name, node_func = _ANALYST_NODES[key]
+        if key in ANALYTICAL_KEYS:
             workflow.add_node(node_name, node_func)
             workflow.add_edge("discovery", node_name)
             all_analytical_node_ids.append(node_name)
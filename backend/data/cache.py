@@ -1,9 +1,45 @@
 from __future__ import annotations
 import json
 import sqlite3
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Field that uniquely identifies a record within each cache category (used for merging)
+_KEY_FIELDS: dict[str, str] = {
+    "prices": "time",
+    "financial_metrics": "report_period",
+    "line_items": "report_period",
+    "insider_trades": "filing_date",
+    "company_news": "date",
+}
+
+def _dumps(data: Any) -> str:
+    # orjson writes the same compact JSON several times faster on long price histories, but
+    # encodes NaN as null (json.dumps writes a bare NaN); stdlib handles what orjson rejects
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:
+            pass
+    return json.dumps(data)
+
+
+def _loads(raw: str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Rows written by json.dumps may contain bare NaN, which orjson refuses
+            pass
+    return json.loads(raw)
+
+
 class Cache:
     """Persistent SQLite-backed cache for API responses."""
 
@@ -35,7 +71,7 @@ class Cache:
                 )
                 row = cursor.fetchone()
                 if row:
-                    return json.loads(row[0])
+                    return _loads(row[0])
         except Exception as e:
             print(f"Cache Read Error: {e}")
         return None
@@ -46,16 +82,10 @@ class Cache:
             existing = self._get(category, key) or []
             
             # 2. Merge (Logic from original cache)
-            key_fields = {
-                "prices": "time",
-                "financial_metrics": "report_period",
-                "line_items": "report_period",
-                "insider_trades": "filing_date",
-                "company_news": "date"
-            }
-            key_field = key_fields.get(category, "id")
-            
-            existing_keys = {item.get(key_field) for item in existing if item.get(key_field)}
+            key_field = _KEY_FIELDS.get(category, "id")
+            getter = itemgetter(key_field)
+
+            existing_keys = {getter(item) for item in existing if item.get(key_field)}
             merged = existing.copy()
             merged.extend([item for item in data if item.get(key_field) not in existing_keys])
             
@@ -63,7 +93,7 @@ class Cache:
             with sqlite3.connect(self.db_path) as conn:
                 conn.execute(
                     "INSERT OR REPLACE INTO api_cache (category, key, data) VALUES (?, ?, ?)",
-                    (category, key, json.dumps(merged))
+                    (category, key, _dumps(merged))
                 )
                 conn.commit()
         except Exception as e:
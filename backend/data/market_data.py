@@ -1,6 +1,17 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
-from typing import List
+from typing import Dict, List, Set, Tuple
+
+SNAPSHOT_MAX_AGE_S = 60.0
+
+# Stale-while-revalidate state: key -> (fetched_at monotonic, snapshot)
+_snapshot_cache: Dict[str, Tuple[float, pd.DataFrame]] = {}
+_snapshot_refreshing: Set[str] = set()
+_snapshot_lock = threading.Lock()
+_SNAPSHOT_REFRESH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot-refresh")
 
 def get_snapshot(symbols: List[str]) -> pd.DataFrame:
     """
@@ -12,12 +23,12 @@ def get_snapshot(symbols: List[str]) -> pd.DataFrame:
     data = []
     for i, symbol in enumerate(symbols):
         # Deterministic dummy data based on symbol name
-        seed = sum(ord(c) for c in symbol)
-        np.random.seed(seed)
+        # Per-symbol generator (same stream as np.random.seed) so concurrent refreshes don't race on global state
+        rng = np.random.RandomState(sum(ord(c) for c in symbol))
         
-        price = 10 + np.random.random() * 500
-        adv = 1e6 + np.random.random() * 50e6
-        mcap = 100e6 + np.random.random() * 2e12
+        price = 10 + rng.random_sample() * 500
+        adv = 1e6 + rng.random_sample() * 50e6
+        mcap = 100e6 + rng.random_sample() * 2e12
         
         data.append({
             "symbol": symbol,
@@ -29,10 +40,38 @@ def get_snapshot(symbols: List[str]) -> pd.DataFrame:
     
     return pd.DataFrame(data).set_index("symbol")
 
-def get_history(symbols: List[str], lookback_days: int) -> pd.DataFrame:
+def _refresh_snapshot(key: str, symbols: List[str]) -> pd.DataFrame:
+    try:
+        snapshot_df = get_snapshot(symbols)
+        with _snapshot_lock:
+            _snapshot_cache[key] = (time.monotonic(), snapshot_df)
+        return snapshot_df
+    finally:
+        with _snapshot_lock:
+            _snapshot_refreshing.discard(key)
+
+def get_cached_snapshot(key: str, symbols: List[str], max_age_s: float = SNAPSHOT_MAX_AGE_S) -> pd.DataFrame:
+    """
+    Stale-while-revalidate wrapper around get_snapshot, keyed by e.g. market.
+    A cached snapshot is returned immediately; once older than max_age_s a single background
+    refresh is scheduled. Only the very first call per key fetches synchronously.
+    The returned frame is shared between callers and must not be mutated.
+    """
+    with _snapshot_lock:
+        cached = _snapshot_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] > max_age_s and key not in _snapshot_refreshing:
+            _snapshot_refreshing.add(key)
+            _SNAPSHOT_REFRESH_POOL.submit(_refresh_snapshot, key, list(symbols))
+
+    if cached is None:
+        return _refresh_snapshot(key, symbols)
+    return cached[1]
+
+def get_history(symbols: List[str], lookback_days: int, dtype: np.dtype = np.float64) -> pd.DataFrame:
     """
     Returns historical close prices for symbols.
     Wide format: index = date, columns = symbols
+    Pass dtype=np.float32 for bandwidth-bound consumers (the screener factors) that don't need FP64.
     """
     # Simulate historical data
     dates = pd.date_range(end=pd.Timestamp.now(), periods=lookback_days + 30, freq="D")
@@ -40,13 +79,12 @@ def get_history(symbols: List[str], lookback_days: int) -> pd.DataFrame:
     # Build columns into a dictionary first to avoid fragmentation (fixes PerformanceWarnings)
     history_data = {}
     for symbol in symbols:
-        seed = sum(ord(c) for c in symbol)
-        np.random.seed(seed)
+        rng = np.random.RandomState(sum(ord(c) for c in symbol))
         
         # Random walk starting at a deterministic price
-        start_price = 10 + np.random.random() * 500
-        returns = np.random.normal(0.0005, 0.02, len(dates))
+        start_price = 10 + rng.random_sample() * 500
+        returns = rng.normal(0.0005, 0.02, len(dates))
         prices = start_price * np.exp(np.cumsum(returns))
-        history_data[symbol] = prices
+        history_data[symbol] = prices.astype(dtype, copy=False)
         
     return pd.DataFrame(history_data, index=dates)
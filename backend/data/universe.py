@@ -29,7 +29,7 @@ class UniverseSelectionModel:
         """
         Runs the screener to select the top K symbols from the base universe.
         """
-        ranking_result = run_screener(market=market, k=k, config=config)
+        ranking_result = run_screener(market=market, k=k, config=config, background=True)
         
         return UniverseSelectionResult(
             base_count=ranking_result.base_count,
@@ -1,25 +1,30 @@
 import csv
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
+
+_FALLBACK_US_UNIVERSE = ("AAPL", "MSFT", "GOOGL", "AMZN", "META", "NVDA", "TSLA", "AMD", "NFLX", "PLTR")
+
+
+@lru_cache(maxsize=8)
+def _load_base_universe(market: str) -> Tuple[str, ...]:
+    """Parses the universe CSV once per market; the tuple keeps the cached value immutable."""
+    if market != "US":
+        return ()
 
-def get_base_universe(market: str = "US") -> List[str]:
-    """
-    Returns the base universe symbols for a given market.
-    Currently supports 'US' with a static CSV.
-    """
-    if market.upper() != "US":
-        return []
-    
     csv_path = Path(__file__).parent / "universes" / "us_equities.csv"
     if not csv_path.exists():
         # Fallback if file doesn't exist
-        return ["AAPL", "MSFT", "GOOGL", "AMZN", "META", "NVDA", "TSLA", "AMD", "NFLX", "PLTR"]
-    
-    symbols = []
+        return _FALLBACK_US_UNIVERSE
+
     with open(csv_path, "r") as f:
         reader = csv.reader(f)
-        for row in reader:
-            if row:
-                symbols.append(row[0])
-    
-    return symbols
+        return tuple(row[0] for row in reader if row)
+
+
+def get_base_universe(market: str = "US") -> List[str]:
+    """
+    Returns the base universe symbols for a given market.
+    Currently supports 'US' with a static CSV.
+    """
+    return list(_load_base_universe(market.upper()))
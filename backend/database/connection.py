@@ -1,17 +1,47 @@
+import json
+import os
 from pathlib import Path
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib serializer
+    orjson = None
+
 # Get the backend directory path
 BACKEND_DIR = Path(__file__).parent.parent
 DATABASE_PATH = BACKEND_DIR / "hedge_fund.db"
 
-# Database configuration - use absolute path
-DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
+# Database configuration - use absolute path (override with DATABASE_URL, e.g. for PostgreSQL)
+DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DATABASE_PATH}")
+
+
+def json_serializer(obj) -> str:
+    """Serializer for JSON/JSONB binds: orjson (also handles numpy values) with a stdlib fallback"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj)
+
+
+def _engine_kwargs(url: str) -> dict:
+    """Pool settings sized for concurrent flow runs writing cycles and trades"""
+    if url.startswith("sqlite"):
+        return {"connect_args": {"check_same_thread": False}, "pool_pre_ping": True, "json_serializer": json_serializer}  # Needed for SQLite
+
+    kwargs = {"pool_size": 20, "max_overflow": 40, "pool_timeout": 30, "pool_recycle": 3600, "pool_pre_ping": True, "json_serializer": json_serializer}
+    if url.startswith("postgresql+psycopg2"):
+        # Batch executemany into multi-row VALUES for bulk cycle/trade inserts (psycopg 3 batches natively)
+        kwargs["executemany_mode"] = "values_plus_batch"
+    return kwargs
+
 
 # Create SQLAlchemy engine
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})  # Needed for SQLite
+engine = create_engine(DATABASE_URL, **_engine_kwargs(DATABASE_URL))
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
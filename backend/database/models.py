@@ -1,23 +1,31 @@
 from __future__ import annotations
 
 from datetime import datetime
+from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy import (
     Boolean,
-    Column,
     DateTime,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     JSON,
+    Numeric,
     String,
     Text,
+    text,
 )
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from .connection import Base
 
+# Binary JSONB (indexable with GIN) on PostgreSQL, plain JSON elsewhere (SQLite dev DB)
+JSONBType = JSON().with_variant(JSONB(), "postgresql")
+
 
 class HedgeFundFlow(Base):
     """Table to store React Flow configurations (nodes, edges, viewport)"""
@@ -33,16 +41,20 @@ class HedgeFundFlow(Base):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # React Flow state
-    nodes: Mapped[List[Dict[str, Any]]] = mapped_column(JSON, nullable=False)
-    edges: Mapped[List[Dict[str, Any]]] = mapped_column(JSON, nullable=False)
+    nodes: Mapped[List[Dict[str, Any]]] = mapped_column(JSONBType, nullable=False)
+    edges: Mapped[List[Dict[str, Any]]] = mapped_column(JSONBType, nullable=False)
     viewport: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
-    data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONBType, nullable=True)
 
     # Additional metadata
     is_template: Mapped[bool] = mapped_column(Boolean, default=False)
     tags: Mapped[Optional[List[str]]] = mapped_column(JSON, nullable=True)
 
 
+# Case-insensitive exact name lookups (FlowRepository.get_flows_by_name)
+Index("ix_flow_name_lower", func.lower(HedgeFundFlow.name))
+
+
 class HedgeFundFlowRun(Base):
     """Table to track individual execution runs of a hedge fund flow"""
 
@@ -64,7 +76,7 @@ class HedgeFundFlowRun(Base):
     duration: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
     # Run data
-    request_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    request_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONBType, nullable=True)
     initial_portfolio: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     final_portfolio: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     results: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
@@ -73,6 +85,13 @@ class HedgeFundFlowRun(Base):
     # Metadata
     run_number: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
+    # Relationships raise on implicit lazy loads; callers opt in with selectinload()
+    cycles: Mapped[List[HedgeFundFlowRunCycle]] = relationship(
+        back_populates="flow_run", lazy="raise_on_sql", passive_deletes="all", order_by="HedgeFundFlowRunCycle.cycle_number"
+    )
+    trades: Mapped[List[Trade]] = relationship(back_populates="flow_run", lazy="raise_on_sql", passive_deletes="all")
+    proposed_trades: Mapped[List[ProposedTrade]] = relationship(back_populates="flow_run", lazy="raise_on_sql", passive_deletes="all")
+
 
 class HedgeFundFlowRunCycle(Base):
     """Individual analysis cycles within a trading session"""
@@ -89,8 +108,8 @@ class HedgeFundFlowRunCycle(Base):
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Analysis results
-    analyst_signals: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
-    trading_decisions: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    analyst_signals: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONBType, nullable=True)
+    trading_decisions: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONBType, nullable=True)
     executed_trades: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSON, nullable=True)
 
     # Portfolio state after this cycle
@@ -106,12 +125,37 @@ class HedgeFundFlowRunCycle(Base):
     # Cost tracking
     llm_calls_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, default=0)
     api_calls_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, default=0)
-    estimated_cost: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    estimated_cost: Mapped[Optional[Decimal]] = mapped_column(Numeric(18, 4), nullable=True)
 
     # Metadata
     trigger_reason: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     market_conditions: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
 
+    flow_run: Mapped[HedgeFundFlowRun] = relationship(back_populates="cycles", lazy="raise_on_sql")
+
+
+class CyclePerformanceSummary(Base):
+    """Flat, indexed projection of a completed cycle's performance JSON for dashboard reads"""
+
+    __tablename__ = "cycle_performance_summary"
+    __table_args__ = (Index("ix_cycle_performance_summary_run_cycle", "flow_run_id", "cycle_number", unique=True),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    # No FK: on PostgreSQL the cycles table is partitioned and its key is (id, created_at)
+    cycle_id: Mapped[int] = mapped_column(Integer, nullable=False, unique=True)
+    flow_run_id: Mapped[int] = mapped_column(Integer, ForeignKey("hedge_fund_flow_runs.id"), nullable=False)
+    cycle_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Extracted from performance_metrics / portfolio_snapshot
+    pnl: Mapped[Optional[float]] = mapped_column(Numeric(18, 4, asdecimal=False), nullable=True)
+    sharpe: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    gross_exposure: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    net_exposure: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    cash: Mapped[Optional[float]] = mapped_column(Numeric(18, 4, asdecimal=False), nullable=True)
+    equity: Mapped[Optional[float]] = mapped_column(Numeric(18, 4, asdecimal=False), nullable=True)
+    positions_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
 
 class ApiKey(Base):
     """Table to store API keys for various services"""
@@ -136,6 +180,16 @@ class Trade(Base):
     """Table to store trade execution requests and their status (Safety Gate)"""
 
     __tablename__ = "trades"
+    __table_args__ = (
+        # Covering partial index for the Safety-Gate approval poll
+        Index(
+            "idx_trades_pending",
+            "created_at",
+            postgresql_where=text("status = 'PENDING_APPROVAL'"),
+            postgresql_include=["ticker", "action", "quantity", "flow_run_id"],
+            sqlite_where=text("status = 'PENDING_APPROVAL'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -149,11 +203,11 @@ class Trade(Base):
     action: Mapped[str] = mapped_column(String(10), nullable=False)
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
     order_type: Mapped[str] = mapped_column(String(20), default="market")
-    limit_price: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    limit_price: Mapped[Optional[Decimal]] = mapped_column(Numeric(18, 4), nullable=True)
 
     # Analysis & Consensus
-    risk_score: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
-    persona_rationale: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    risk_score: Mapped[Optional[Decimal]] = mapped_column(Numeric(18, 4), nullable=True)
+    persona_rationale: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONBType, nullable=True)
 
     # Safety Gate & Execution Status
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="PENDING_APPROVAL", index=True)
@@ -163,10 +217,12 @@ class Trade(Base):
 
     # Execution Details (from Brokerage)
     brokerage_order_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
-    execution_price: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    execution_price: Mapped[Optional[Decimal]] = mapped_column(Numeric(18, 4), nullable=True)
     execution_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    flow_run: Mapped[Optional[HedgeFundFlowRun]] = relationship(back_populates="trades", lazy="raise_on_sql")
+
 
 class ScreenerRun(Base):
     """Persistence for market-wide screener runs (Ranking as a contract)"""
@@ -184,7 +240,7 @@ class ScreenerRun(Base):
 
     # Store top K and full factor table
     selected_symbols: Mapped[List[str]] = mapped_column(JSON, nullable=False)
-    ranking_data: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    ranking_data: Mapped[Dict[str, Any]] = mapped_column(JSONBType, nullable=False)
 
     # Configuration used
     config: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
@@ -195,6 +251,15 @@ class ProposedTrade(Base):
     """Table to store trades proposed by the Investment Committee for HITL approval."""
 
     __tablename__ = "proposed_trades"
+    __table_args__ = (
+        Index(
+            "idx_proposed_trades_pending",
+            "created_at",
+            postgresql_where=text("status = 'PENDING'"),
+            postgresql_include=["ticker", "action", "quantity", "flow_run_id"],
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     ticker: Mapped[str] = mapped_column(String(20), nullable=False)
@@ -204,4 +269,6 @@ class ProposedTrade(Base):
     status: Mapped[str] = mapped_column(String(50), default="PENDING")
     approval_token: Mapped[Optional[str]] = mapped_column(String(100), unique=True, index=True, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    flow_run_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("hedge_fund_flow_runs.id"), nullable=True)
\ No newline at end of file
+    flow_run_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("hedge_fund_flow_runs.id"), nullable=True)
+
+    flow_run: Mapped[Optional[HedgeFundFlowRun]] = relationship(back_populates="proposed_trades", lazy="raise_on_sql")
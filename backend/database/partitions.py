@@ -0,0 +1,22 @@
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Tables converted to RANGE (created_at) partitioning by the 9d4e6f2a3b58 migration
+PARTITIONED_TABLES = ("hedge_fund_flow_run_cycles", "trades")
+
+
+def roll_forward_partitions(engine: Engine, months_ahead: int = 3) -> None:
+    """Ensure monthly partitions exist from the current month through `months_ahead` (PostgreSQL only)"""
+    if engine.dialect.name != "postgresql":
+        return
+
+    try:
+        with engine.begin() as conn:
+            for table in PARTITIONED_TABLES:
+                conn.execute(text("SELECT create_monthly_partitions(:table, current_date, :months)"), {"table": table, "months": months_ahead})
+    except Exception as e:
+        logger.warning(f"Could not roll forward table partitions: {e}")
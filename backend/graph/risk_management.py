@@ -1,8 +1,58 @@
 from __future__ import annotations
+import logging
 from typing import List
+import numpy as np
 from lean_bridge.contracts import PortfolioTarget
 from lean_bridge.context import AlgorithmContext
 
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the NumPy version
+    njit = None
+
+
+def _adjust_qty_np(qty: np.ndarray, px: np.ndarray, z: np.ndarray, min_z: float, max_conc: float, total_equity: float):
+    """Applies the distress veto and concentration cap; returns (new_qty, veto_mask, capped_mask)."""
+    veto = (z < min_z) & (z != 0)
+    qty = np.where(veto, 0.0, qty)
+
+    # Sign-preserving floor division, as in the original per-target loop
+    cap = total_equity * max_conc
+    capped = (px > 0) & (np.abs(qty * px) > cap)
+    sign = np.where(qty > 0, 1.0, -1.0)
+    qty = np.where(capped, np.floor_divide(cap * sign, np.where(px > 0, px, 1.0)), qty)
+    return qty, veto, capped
+
+
+def _adjust_qty_loop(qty: np.ndarray, px: np.ndarray, z: np.ndarray, min_z: float, max_conc: float, total_equity: float):
+    # Same gates as _adjust_qty_np, written element-wise so numba can compile it into one pass
+    n = qty.shape[0]
+    new_qty = np.empty(n, dtype=np.float64)
+    veto = np.zeros(n, dtype=np.bool_)
+    capped = np.zeros(n, dtype=np.bool_)
+    cap = total_equity * max_conc
+    for i in range(n):
+        q = qty[i]
+        if z[i] < min_z and z[i] != 0:
+            veto[i] = True
+            q = 0.0
+        p = px[i]
+        if p > 0 and abs(q * p) > cap:
+            capped[i] = True
+            q = (cap if q > 0 else -cap) // p
+        new_qty[i] = q
+    return new_qty, veto, capped
+
+
+if njit is not None:
+    # No fastmath: the gates are comparisons and must keep IEEE NaN semantics
+    _adjust_qty = njit(cache=True)(_adjust_qty_loop)
+    _adjust_qty(np.zeros(1), np.zeros(1), np.zeros(1), 1.8, 0.2, 1.0)
+else:
+    _adjust_qty = _adjust_qty_np
+
 class InstitutionalRiskModel:
     """
     LEAN-faithful Risk Management Model.
@@ -18,39 +68,29 @@ class InstitutionalRiskModel:
         1. Altman Z-Score distress filter.
         2. Position concentration cap.
         """
-        quant_scorecard = context.config.get("quant_scorecard", {})
         portfolio = context.portfolio_state
         total_equity = float(portfolio.get("equity", 100000.0))
-        current_prices = context.config.get("current_prices", {})
-
-        adjusted_targets = []
-        for target in targets:
-            symbol = target.symbol
-            scorecard = quant_scorecard.get(symbol, {})
-            metrics = scorecard.get("metrics", {})
-            
-            # Use original value as base for adjustment
-            new_quantity = target.quantity
-            
-            # 1. Altman Z-Score Check (Institutional Distress Gate)
-            z_score = metrics.get("altman_z", 0.0)
-            if z_score < self.min_altman_z and z_score != 0:
-                print(f"RISK VETO: {symbol} Altman Z-Score {z_score:.2f} < {self.min_altman_z} (Distress)")
-                new_quantity = 0 
-            
-            # 2. Concentration Cap
-            price = float(current_prices.get(symbol, 0.0))
-            if price > 0:
-                target_value = abs(new_quantity * price)
-                if target_value > total_equity * self.max_concentration:
-                    print(f"RISK LIMIT: Capping {symbol} size to {self.max_concentration:.0%} of equity")
-                    new_quantity = int((total_equity * self.max_concentration * (1 if new_quantity > 0 else -1)) // price)
-
-            # Create NEW immutable instance with adjusted quantity
-            adjusted_targets.append(PortfolioTarget(
-                symbol=symbol, 
-                quantity=new_quantity, 
-                tag=target.tag
-            ))
-
-        return adjusted_targets
\ No newline at end of file
+
+        if not targets:
+            return []
+
+        symbols = [t.symbol for t in targets]
+        qty = np.array([t.quantity for t in targets], dtype=np.float64)
+        z, px = context.symbol_views(symbols)
+
+        # 1. Altman Z-Score Check (Institutional Distress Gate) + 2. Concentration Cap
+        qty, veto, capped = _adjust_qty(qty, px, z, float(self.min_altman_z), float(self.max_concentration), total_equity)
+
+        # One batched, lazily formatted message per gate instead of a print per symbol
+        if logger.isEnabledFor(logging.INFO):
+            if veto.any():
+                vetoed = {symbols[i]: round(float(z[i]), 2) for i in np.flatnonzero(veto)}
+                logger.info("RISK VETO: Altman Z-Score < %.2f (Distress): %s", self.min_altman_z, vetoed)
+            if capped.any():
+                logger.info("RISK LIMIT: Capping to %.0f%% of equity: %s", self.max_concentration * 100, [symbols[i] for i in np.flatnonzero(capped)])
+
+        # Create NEW immutable instances with adjusted quantity
+        return [
+            PortfolioTarget(symbol=symbol, quantity=new_quantity, tag=target.tag)
+            for symbol, new_quantity, target in zip(symbols, qty.tolist(), targets)
+        ]
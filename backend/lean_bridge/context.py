@@ -1,8 +1,10 @@
 from __future__ import annotations
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field
-from lean_bridge.contracts import Insight
+import heapq
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr
+from lean_bridge.contracts import Insight, to_epoch_ns
 
 class AlgorithmContext(BaseModel):
     """
@@ -15,25 +17,103 @@ class AlgorithmContext(BaseModel):
     portfolio_state: Dict[str, Any]
     config: Dict[str, Any]
     insights: List[Insight] = Field(default_factory=list)
+    # Min-heap of (expiry_ns, seq, insight): expiry only touches insights that actually expired
+    _expiry_heap: List[Tuple[int, int, Insight]] = PrivateAttr(default_factory=list)
+    _seq: int = PrivateAttr(default=0)
+    # (id, len) of the insight list the heap was built from; catches direct edits to `insights`
+    _tracked: Tuple[int, int] = PrivateAttr(default=(0, 0))
+    # (time, list id, list len, active insights) memo; invalidated whenever the insight list changes
+    _active_cache: Optional[Tuple[datetime, int, int, List[Insight]]] = PrivateAttr(default=None)
+    # Per-tick array views of quant_scorecard / current_prices aligned to _symbol_to_idx
+    _symbol_to_idx: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _z_by_symbol: Optional[np.ndarray] = PrivateAttr(default=None)
+    _px_by_symbol: Optional[np.ndarray] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._push_expiries(self.insights)
+        self._tracked = (id(self.insights), len(self.insights))
+
+    def _push_expiries(self, insights: List[Insight]):
+        for insight in insights:
+            heapq.heappush(self._expiry_heap, (insight.expiry_ns, self._seq, insight))
+            self._seq += 1
+
+    def _sync_expiries(self):
+        """Re-indexes expiries when `insights` was assigned or appended to directly."""
+        list_id, length = id(self.insights), len(self.insights)
+        tracked_id, tracked_len = self._tracked
+        if (list_id, length) == (tracked_id, tracked_len):
+            return
+        if list_id == tracked_id and length > tracked_len:
+            self._push_expiries(self.insights[tracked_len:])
+        else:
+            self._expiry_heap = []
+            self._push_expiries(self.insights)
+        self._tracked = (list_id, length)
+        self._active_cache = None
 
     @property
     def active_insights(self) -> List[Insight]:
         """Returns all currently valid, non-expired insights."""
-        return [
-            i for i in self.insights
-            if not i.is_expired(self.time)
-        ]
+        self._sync_expiries()
+        cache = self._active_cache
+        if cache is not None and cache[:3] == (self.time, id(self.insights), len(self.insights)):
+            return list(cache[3])
+
+        heap = self._expiry_heap
+        now_ns = to_epoch_ns(self.time)
+        if not heap or heap[0][0] > now_ns:
+            active = list(self.insights)
+        else:
+            active = [
+                i for i in self.insights
+                if not i.is_expired(now_ns)
+            ]
+        self._active_cache = (self.time, id(self.insights), len(self.insights), active)
+        return list(active)
 
     def add_insights(self, insights: List[Insight]):
         """Adds new insights to the context."""
+        self._sync_expiries()
         self.insights.extend(insights)
+        self._push_expiries(insights)
+        self._tracked = (id(self.insights), len(self.insights))
+        self._active_cache = None
 
     def clear_expired_insights(self, utc_time: datetime):
         """Removes all insights that have passed their expiry window."""
-        self.insights = [
-            i for i in self.insights
-            if not i.is_expired(utc_time)
-        ]
+        self._sync_expiries()
+        now_ns = to_epoch_ns(utc_time)
+        heap = self._expiry_heap
+        expired_ids = set()
+        while heap and heap[0][0] <= now_ns:
+            expired_ids.add(id(heapq.heappop(heap)[2]))
+        if expired_ids:
+            self.insights = [i for i in self.insights if id(i) not in expired_ids]
+            self._tracked = (id(self.insights), len(self.insights))
+            self._active_cache = None
+
+    def prime_views(self, universe: Optional[List[str]] = None):
+        """Projects Altman Z and current prices into arrays once per tick."""
+        symbols = list(dict.fromkeys(universe if universe is not None else self.universe))
+        quant_scorecard = self.config.get("quant_scorecard", {})
+        current_prices = self.config.get("current_prices", {})
+
+        self._symbol_to_idx = {s: i for i, s in enumerate(symbols)}
+        self._z_by_symbol = np.array(
+            [float(quant_scorecard.get(s, {}).get("metrics", {}).get("altman_z", 0.0) or 0.0) for s in symbols], dtype=np.float64
+        )
+        self._px_by_symbol = np.array([float(current_prices.get(s, 0.0)) for s in symbols], dtype=np.float64)
+
+    def symbol_views(self, symbols: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (altman_z, price) arrays aligned to `symbols`, priming views for unseen symbols."""
+        lookup = self._symbol_to_idx
+        missing = [s for s in symbols if s not in lookup]
+        if missing or self._z_by_symbol is None:
+            self.prime_views(list(lookup) + missing)
+            lookup = self._symbol_to_idx
+        idx = np.fromiter((lookup[s] for s in symbols), dtype=np.intp, count=len(symbols))
+        return self._z_by_symbol[idx], self._px_by_symbol[idx]
 
     def get_history(self, symbols: List[str], lookback: int):
         """
@@ -1,14 +1,32 @@
 from __future__ import annotations
 from enum import Enum
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Optional, List, Dict, Any, Union, TYPE_CHECKING
+from dataclasses import FrozenInstanceError, dataclass, field, fields
 from datetime import datetime, timedelta, UTC
+from functools import lru_cache
 import math
+import sys
 from abc import ABC, abstractmethod
 
 if TYPE_CHECKING:
     from lean_bridge.context import AlgorithmContext
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_US = timedelta(microseconds=1)
+
+
+def to_epoch_ns(dt: datetime) -> int:
+    """Exact epoch nanoseconds (float timestamp() * 1e9 loses sub-microsecond precision)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return ((dt - _EPOCH) // _US) * 1_000
+
+
+def to_ns(delta: timedelta) -> int:
+    """Exact nanoseconds in a timedelta."""
+    return (delta // _US) * 1_000
+
+
 class InsightDirection(int, Enum):
     FLAT = 0
     UP = 1
@@ -18,44 +36,74 @@ class InsightType(str, Enum):
     PRICE = "price"
     VOLATILITY = "volatility"
 
-class Insight(BaseModel):
+class FrozenContractError(FrozenInstanceError, TypeError):
+    """Raised on assignment to an immutable contract object."""
+
+
+def _immutable(cls):
+    """Make attribute assignment/deletion raise FrozenContractError (also a TypeError)."""
+    def _frozen(self, name, *args):
+        raise FrozenContractError(f"{type(self).__name__} is immutable; cannot modify '{name}'")
+
+    cls.__setattr__ = _frozen
+    cls.__delattr__ = _frozen
+    return cls
+
+
+@_immutable
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Insight:
     """
     LEAN-faithful Insight object.
-    Immutable (Frozen) to ensure contract integrity.
+    Immutable (frozen, slotted dataclass) to ensure contract integrity.
+    Hot-path construction only runs the checks in __post_init__; use from_dict for JSON ingress.
     """
-    model_config = ConfigDict(frozen=True)
-
     symbol: str
-    generated_time_utc: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    generated_time_utc: datetime = field(default_factory=lambda: datetime.now(UTC))
     period: timedelta
     type: InsightType = InsightType.PRICE
     direction: InsightDirection
     magnitude: float  # Required for MVO
-    confidence: float = Field(default=0.0, ge=0.0, le=1.0) # Strict range 0..1
+    confidence: float = 0.0  # Strict range 0..1
     weight: Optional[float] = None
     source_model: str
     tag: Optional[str] = None
-
-    @field_validator('magnitude')
-    @classmethod
-    def check_finite_magnitude(cls, v: float) -> float:
-        if not math.isfinite(v):
+    # Canonical integer timestamps (epoch ns), derived once at construction; datetimes are kept
+    # for serialization boundaries
+    generated_time_utc_ns: int = field(init=False, repr=False, compare=False)
+    period_ns: int = field(init=False, repr=False, compare=False)
+    expiry_ns: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        magnitude = float(self.magnitude)
+        if not math.isfinite(magnitude):
             raise ValueError("Magnitude must be a finite number (not NaN or Inf)")
-        return v
-
-    @field_validator('period')
-    @classmethod
-    def check_positive_period(cls, v: timedelta) -> timedelta:
-        if v.total_seconds() <= 0:
+        if self.period.total_seconds() <= 0:
             raise ValueError("Period must be greater than zero")
-        return v
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError("Confidence must be between 0 and 1")
+
+        set_field = object.__setattr__
+        # Interned strings make the (symbol, source_model) collection key hash/compare by pointer
+        set_field(self, "symbol", sys.intern(self.symbol))
+        set_field(self, "source_model", sys.intern(self.source_model))
+        set_field(self, "magnitude", magnitude)
+        set_field(self, "direction", InsightDirection(self.direction))
+        set_field(self, "type", InsightType(self.type))
+        if self.generated_time_utc.tzinfo is None:
+            set_field(self, "generated_time_utc", self.generated_time_utc.replace(tzinfo=UTC))
+        set_field(self, "generated_time_utc_ns", to_epoch_ns(self.generated_time_utc))
+        set_field(self, "period_ns", to_ns(self.period))
+        # Immutable, so expiry is fixed at construction and is_expired is a single int compare
+        set_field(self, "expiry_ns", self.generated_time_utc_ns + self.period_ns)
 
-    @field_validator('generated_time_utc', mode='before')
     @classmethod
-    def ensure_utc(cls, v: Any) -> datetime:
-        if isinstance(v, datetime) and v.tzinfo is None:
-            return v.replace(tzinfo=UTC)
-        return v
+    def from_dict(cls, data: Dict[str, Any]) -> "Insight":
+        """Validating constructor for serialized payloads (ISO strings, enum values, etc.)."""
+        return _insight_adapter().validate_python(data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in _INSIGHT_FIELDS}
 
     @classmethod
     def price(cls, symbol: str, period: timedelta, direction: InsightDirection, 
@@ -71,22 +119,42 @@ class Insight(BaseModel):
             tag=tag
         )
 
-    def is_expired(self, utc_time: datetime) -> bool:
-        # Standardize utc_time comparison
-        compare_time = utc_time if utc_time.tzinfo else utc_time.replace(tzinfo=UTC)
-        return self.generated_time_utc + self.period <= compare_time
+    def is_expired(self, utc_time: Union[datetime, int]) -> bool:
+        """`utc_time` may be a datetime or epoch nanoseconds (preferred in loops)."""
+        now_ns = utc_time if isinstance(utc_time, int) else to_epoch_ns(utc_time)
+        return self.expiry_ns <= now_ns
 
-class PortfolioTarget(BaseModel):
+_INSIGHT_FIELDS = tuple(f.name for f in fields(Insight) if f.init)
+
+
+@_immutable
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PortfolioTarget:
     """
     LEAN-faithful PortfolioTarget.
-    Immutable (Frozen) to ensure target consistency.
+    Immutable (frozen, slotted dataclass) to ensure target consistency.
     """
-    model_config = ConfigDict(frozen=True)
-
     symbol: str
     quantity: float
     tag: Optional[str] = None
 
+    def __post_init__(self):
+        object.__setattr__(self, "symbol", sys.intern(self.symbol))
+        object.__setattr__(self, "quantity", float(self.quantity))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PortfolioTarget":
+        return cls(symbol=str(data["symbol"]), quantity=data["quantity"], tag=data.get("tag"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"symbol": self.symbol, "quantity": self.quantity, "tag": self.tag}
+
+
+@lru_cache(maxsize=1)
+def _insight_adapter():
+    from pydantic import TypeAdapter
+    return TypeAdapter(Insight)
+
 class AlphaModel(ABC):
     @property
     @abstractmethod
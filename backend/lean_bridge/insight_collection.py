@@ -1,53 +1,114 @@
 from __future__ import annotations
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
-from lean_bridge.contracts import Insight
+import heapq
+import numpy as np
+from lean_bridge.contracts import Insight, to_epoch_ns
+
+_INITIAL_CAPACITY = 64
+
 
 class InsightCollection:
     """
     Manages active insights, mimicking LEAN's InsightManager.
     Enforces deterministic replacement: One active insight per (symbol, source_model).
+
+    Stored as Structure-of-Arrays: liveness and expiry/generation timestamps live in
+    NumPy arrays so expiry checks are a single vectorized compare. `_row` maps
+    (symbol, source_model) -> row index; freed rows are recycled via a free-list.
+    A min-heap of (expiry_ns, key) makes `remove_expired` O(k log N) in the number
+    of insights that actually expired instead of a full scan every tick.
     """
     def __init__(self):
-        # Store: { (symbol, source_model): Insight }
-        self._active_insights: Dict[Tuple[str, str], Insight] = {}
+        self._row: Dict[Tuple[str, str], int] = {}
+        self._keys: List[Optional[Tuple[str, str]]] = []
+        self._insights: List[Optional[Insight]] = []
+        self._free: List[int] = []
+        self._size = 0
+        self._expiry_heap: List[Tuple[int, Tuple[str, str]]] = []
+
+        self._live = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self._expiry_ns = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._generated_ns = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+
+    def _grow(self):
+        capacity = len(self._live) * 2
+        for name in ("_live", "_expiry_ns", "_generated_ns"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            setattr(self, name, new)
+
+    def _alloc_row(self, key: Tuple[str, str]) -> int:
+        if self._free:
+            row = self._free.pop()
+            self._keys[row] = key
+            return row
+        if self._size == len(self._live):
+            self._grow()
+        row = self._size
+        self._size += 1
+        self._keys.append(key)
+        self._insights.append(None)
+        return row
+
+    def _write_row(self, row: int, insight: Insight, generated_ns: int):
+        expiry_ns = insight.expiry_ns
+        self._insights[row] = insight
+        self._live[row] = True
+        self._generated_ns[row] = generated_ns
+        self._expiry_ns[row] = expiry_ns
+        heapq.heappush(self._expiry_heap, (expiry_ns, self._keys[row]))
+
+    def _free_row(self, row: int):
+        key = self._keys[row]
+        if key is not None:
+            del self._row[key]
+        self._keys[row] = None
+        self._insights[row] = None
+        self._live[row] = False
+        self._free.append(row)
 
     def add(self, insights: List[Insight]):
         """
         Adds new insights, overwriting older ones from the same model for the same symbol.
-        Deterministic rule: Keep the most recent by generated_time_utc. 
+        Deterministic rule: Keep the most recent by generated_time_utc.
         If timestamps are identical, last write wins (last in list).
         """
         for insight in insights:
             key = (insight.symbol, insight.source_model)
-            if key not in self._active_insights:
-                self._active_insights[key] = insight
-            else:
-                # Keep the most recent by timestamp
-                if insight.generated_time_utc >= self._active_insights[key].generated_time_utc:
-                    self._active_insights[key] = insight
+            generated_ns = insight.generated_time_utc_ns
+            row = self._row.get(key)
+            if row is None:
+                row = self._alloc_row(key)
+                self._row[key] = row
+            elif generated_ns < self._generated_ns[row]:
+                continue
+            self._write_row(row, insight, generated_ns)
+
+    def _active_mask(self, utc_time: datetime) -> np.ndarray:
+        n = self._size
+        return self._live[:n] & (self._expiry_ns[:n] > to_epoch_ns(utc_time))
 
     def remove_expired(self, utc_time: datetime):
         """Removes all insights that have passed their expiry window."""
-        expired_keys = [
-            key for key, insight in self._active_insights.items()
-            if insight.is_expired(utc_time)
-        ]
-        for key in expired_keys:
-            del self._active_insights[key]
+        now_ns = to_epoch_ns(utc_time)
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now_ns:
+            expiry_ns, key = heapq.heappop(heap)
+            row = self._row.get(key)
+            # Stale entry: the key was replaced by a newer insight or already cleared
+            if row is None or self._expiry_ns[row] != expiry_ns:
+                continue
+            self._free_row(row)
 
     def clear(self, symbols: List[str]):
         """Force-removes all insights for symbols that have left the universe."""
-        keys_to_remove = [
-            key for key in self._active_insights.keys()
-            if key[0] in symbols
-        ]
-        for key in keys_to_remove:
-            del self._active_insights[key]
+        symbol_set = set(symbols)
+        for key in [k for k in self._row if k[0] in symbol_set]:
+            self._free_row(self._row[key])
 
     def get_active_insights(self, utc_time: datetime) -> List[Insight]:
         """Returns all currently valid, non-expired insights."""
-        return [
-            i for i in self._active_insights.values()
-            if not i.is_expired(utc_time)
-        ]
\ No newline at end of file
+        insights = self._insights
+        return [insights[i] for i in np.flatnonzero(self._active_mask(utc_time))]
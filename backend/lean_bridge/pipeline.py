@@ -1,8 +1,19 @@
+import asyncio
+import inspect
+from itertools import chain
 from typing import List
 from lean_bridge.contracts import Insight, PortfolioTarget, AlphaModel
 from lean_bridge.context import AlgorithmContext
 
-def run_lean_pipeline(
+
+async def _run_alpha(model: AlphaModel, context: AlgorithmContext, data: dict) -> List[Insight]:
+    """Awaits async alpha models directly; sync ones run in a worker thread."""
+    if inspect.iscoroutinefunction(model.update):
+        return await model.update(context, data)
+    return await asyncio.to_thread(model.update, context, data)
+
+
+async def run_lean_pipeline(
     context: AlgorithmContext, 
     alpha_models: List[AlphaModel],
     portfolio_model,
@@ -13,14 +24,13 @@ def run_lean_pipeline(
     """
     Executes the LEAN Algorithm Framework assembly line.
     """
-    # 1. Alpha Layer: Generate Insights
-    new_insights = []
-    for model in alpha_models:
-        insights = model.update(context, data)
-        new_insights.extend(insights)
+    # 1. Alpha Layer: Generate Insights (independent models fan out concurrently)
+    insights_per_model = await asyncio.gather(*(_run_alpha(model, context, data) for model in alpha_models))
+    new_insights = list(chain.from_iterable(insights_per_model))
     
     context.add_insights(new_insights)
     context.clear_expired_insights(context.time)
+    context.prime_views()
 
     # 2. Portfolio Construction: Insights -> Targets
     targets = portfolio_model.create_targets(context.active_insights, context)
@@ -31,4 +41,4 @@ def run_lean_pipeline(
     # 4. Execution: Targets -> Orders
     execution_plan = execution_model.execute(adjusted_targets, context)
 
-    return execution_plan
\ No newline at end of file
+    return execution_plan
@@ -1,21 +1,19 @@
+import importlib
 import json
 import os
 from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Tuple, Union, Any, Dict
 
-from langchain_anthropic import ChatAnthropic
-from langchain_deepseek import ChatDeepSeek
-from langchain_gigachat import GigaChat
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_groq import ChatGroq
-from langchain_ollama import ChatOllama
-from langchain_openai import AzureChatOpenAI, ChatOpenAI
-from langchain_xai import ChatXAI
 from pydantic import BaseModel, SecretStr
 
 from utils.signature import validate_and_filter_kwargs
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
 
 class ModelProvider(str, Enum):
     """Enum for supported LLM providers"""
@@ -77,16 +75,15 @@ class LLMModel(BaseModel):
 
 # Load models from JSON file
 def load_models_from_json(json_path: str) -> List[LLMModel]:
-    """Load models from a JSON file"""
-    with open(json_path, "r") as f:
-        models_data = json.load(f)
+    """Load models from a JSON file (bundled, trusted assets, so pydantic validation is skipped)"""
+    with open(json_path, "rb") as f:
+        raw = f.read()
+    models_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-    models = []
-    for model_data in models_data:
-        # Convert string provider to ModelProvider enum
-        provider_enum = ModelProvider(model_data["provider"])
-        models.append(LLMModel(display_name=model_data["display_name"], model_name=model_data["model_name"], provider=provider_enum))
-    return models
+    return [
+        LLMModel.model_construct(display_name=model_data["display_name"], model_name=model_data["model_name"], provider=ModelProvider(model_data["provider"]))
+        for model_data in models_data
+    ]
 
 
 # Get the path to the JSON files
@@ -100,6 +97,13 @@ AVAILABLE_MODELS = load_models_from_json(str(models_json_path))
 # Load Ollama models from JSON
 OLLAMA_MODELS = load_models_from_json(str(ollama_models_json_path))
 
+ALL_MODELS: Tuple[LLMModel, ...] = tuple(AVAILABLE_MODELS + OLLAMA_MODELS)
+
+# Static API payload for cloud models; a tuple so callers can't mutate the shared copy
+MODELS_LIST_PAYLOAD: Tuple[Dict[str, str], ...] = tuple(
+    {"display_name": model.display_name, "model_name": model.model_name, "provider": model.provider.value} for model in AVAILABLE_MODELS
+)
+
 # Create LLM_ORDER in the format expected by the UI
 LLM_ORDER = [model.to_choice_tuple() for model in AVAILABLE_MODELS]
 
@@ -107,48 +111,114 @@ LLM_ORDER = [model.to_choice_tuple() for model in AVAILABLE_MODELS]
 OLLAMA_LLM_ORDER = [model.to_choice_tuple() for model in OLLAMA_MODELS]
 
 
+# Provider SDKs are imported on first use: a run only needs one of them
+_PROVIDERS: Dict[ModelProvider, Tuple[str, str]] = {
+    ModelProvider.ANTHROPIC: ("langchain_anthropic", "ChatAnthropic"),
+    ModelProvider.DEEPSEEK: ("langchain_deepseek", "ChatDeepSeek"),
+    ModelProvider.GIGACHAT: ("langchain_gigachat", "GigaChat"),
+    ModelProvider.GOOGLE: ("langchain_google_genai", "ChatGoogleGenerativeAI"),
+    ModelProvider.GROQ: ("langchain_groq", "ChatGroq"),
+    ModelProvider.OLLAMA: ("langchain_ollama", "ChatOllama"),
+    ModelProvider.OPENAI: ("langchain_openai", "ChatOpenAI"),
+    ModelProvider.OPENROUTER: ("langchain_openai", "ChatOpenAI"),
+    ModelProvider.AZURE_OPENAI: ("langchain_openai", "AzureChatOpenAI"),
+    ModelProvider.XAI: ("langchain_xai", "ChatXAI"),
+}
+
+_CLASS_CACHE: Dict[ModelProvider, type] = {}
+
+
+def _provider_class(model_provider: ModelProvider) -> type:
+    """Import and cache the LangChain chat class for a provider"""
+    provider_cls = _CLASS_CACHE.get(model_provider)
+    if provider_cls is None:
+        module, cls_name = _PROVIDERS[model_provider]
+        provider_cls = _CLASS_CACHE[model_provider] = getattr(importlib.import_module(module), cls_name)
+    return provider_cls
+
+
+# O(1) lookups built once at import; the first entry wins for duplicate names
+_BY_NAME_PROVIDER: Dict[Tuple[str, str], LLMModel] = {}
+_BY_NAME: Dict[str, LLMModel] = {}
+for _model in ALL_MODELS:
+    _BY_NAME_PROVIDER.setdefault((_model.model_name, _model.provider.value), _model)
+    _BY_NAME.setdefault(_model.model_name, _model)
+
+# Accepts either the provider value ("OpenAI") or enum name ("OPENAI"), case-insensitively
+_PROVIDER_NORMALIZE: Dict[str, str] = {p.value.lower(): p.value for p in ModelProvider} | {p.name.lower(): p.value for p in ModelProvider}
+
+
 def get_model_info(model_name: str, model_provider: str) -> Optional[LLMModel]:
     """Get model information by model_name"""
-    all_models = AVAILABLE_MODELS + OLLAMA_MODELS
     # Normalize model_provider if it's a string like "OPENAI"
     normalized_provider = model_provider
     if isinstance(model_provider, str):
-        for p in ModelProvider:
-            if p.value.lower() == model_provider.lower() or p.name.lower() == model_provider.lower():
-                normalized_provider = p.value
-                break
-
-    return next((model for model in all_models if model.model_name == model_name and model.provider == normalized_provider), None)
+        normalized_provider = _PROVIDER_NORMALIZE.get(model_provider.lower(), model_provider)
+    return _BY_NAME_PROVIDER.get((model_name, normalized_provider))
 
 
 def find_model_by_name(model_name: str) -> Optional[LLMModel]:
     """Find a model by its name across all available models."""
-    all_models = AVAILABLE_MODELS + OLLAMA_MODELS
-    return next((model for model in all_models if model.model_name == model_name), None)
+    return _BY_NAME.get(model_name)
 
 
-def get_models_list():
+def get_models_list() -> Tuple[Dict[str, str], ...]:
     """Get the list of models for API responses."""
-    return [{"display_name": model.display_name, "model_name": model.model_name, "provider": model.provider.value} for model in AVAILABLE_MODELS]
+    return MODELS_LIST_PAYLOAD
+
+
+def _normalize_provider(model_provider: Union[ModelProvider, str]) -> ModelProvider:
+    """Normalize model_provider to ModelProvider enum if it's a string"""
+    if isinstance(model_provider, ModelProvider):
+        return model_provider
+    # Match by value (e.g., "OpenAI") or by name (e.g., "OPENAI"), case-insensitively
+    normalized = _PROVIDER_NORMALIZE.get(model_provider.lower())
+    if normalized is None:
+        print(f"Warning: Unknown model provider '{model_provider}'. Falling back to OpenAI.")
+        return ModelProvider.OPENAI
+    return ModelProvider(normalized)
+
+
+# api_keys entry a request can use to override each provider's environment credentials
+_PROVIDER_API_KEY: Dict[ModelProvider, str] = {
+    ModelProvider.GROQ: "GROQ_API_KEY",
+    ModelProvider.OPENAI: "OPENAI_API_KEY",
+    ModelProvider.ANTHROPIC: "ANTHROPIC_API_KEY",
+    ModelProvider.DEEPSEEK: "DEEPSEEK_API_KEY",
+    ModelProvider.GOOGLE: "GOOGLE_API_KEY",
+    ModelProvider.OPENROUTER: "OPENROUTER_API_KEY",
+    ModelProvider.XAI: "XAI_API_KEY",
+    ModelProvider.GIGACHAT: "GIGACHAT_API_KEY",
+}
+
+# Instances built at startup by preload_model, keyed by (model_name, provider value)
+_PRELOADED: Dict[Tuple[str, str], Any] = {}
+
+
+def _uses_env_credentials(model_provider: ModelProvider, api_keys: Optional[dict]) -> bool:
+    key_name = _PROVIDER_API_KEY.get(model_provider)
+    if key_name is None:
+        return True
+    override = (api_keys or {}).get(key_name)
+    return not override or override == os.getenv(key_name)
 
 
-def get_model(model_name: str, model_provider: Union[ModelProvider, str], api_keys: Optional[dict] = None) -> Optional[Union[ChatOpenAI, ChatGroq, ChatOllama, GigaChat, ChatAnthropic, ChatDeepSeek, ChatGoogleGenerativeAI, ChatXAI, AzureChatOpenAI]]:
-    # Normalize model_provider to ModelProvider enum if it's a string
-    if isinstance(model_provider, str):
-        try:
-            # Try to match by value (e.g., "OpenAI")
-            model_provider = ModelProvider(model_provider)
-        except ValueError:
-            # Try to match by name (e.g., "OPENAI") or case-insensitive value
-            found = False
-            for p in ModelProvider:
-                if p.name.lower() == model_provider.lower() or p.value.lower() == model_provider.lower():
-                    model_provider = p
-                    found = True
-                    break
-            if not found:
-                print(f"Warning: Unknown model provider '{model_provider}'. Falling back to OpenAI.")
-                model_provider = ModelProvider.OPENAI
+def preload_model(model_name: str, model_provider: Union[ModelProvider, str]) -> Optional[Any]:
+    """Build an LLM from environment credentials and reuse it for matching get_model calls"""
+    model_provider = _normalize_provider(model_provider)
+    llm = get_model(model_name, model_provider)
+    if llm is not None:
+        _PRELOADED[(model_name, model_provider.value)] = llm
+    return llm
+
+
+def get_model(model_name: str, model_provider: Union[ModelProvider, str], api_keys: Optional[dict] = None) -> Optional[Any]:
+    model_provider = _normalize_provider(model_provider)
+
+    # Reuse the startup instance unless the request brings its own credentials
+    preloaded = _PRELOADED.get((model_name, model_provider.value))
+    if preloaded is not None and _uses_env_credentials(model_provider, api_keys):
+        return preloaded
 
     # Factory configuration
     kwargs: Dict[str, Any] = {}
@@ -158,47 +228,47 @@ def get_model(model_name: str, model_provider: Union[ModelProvider, str], api_ke
         api_key = (api_keys or {}).get("GROQ_API_KEY") or os.getenv("GROQ_API_KEY")
         if not api_key:
             raise ValueError("Groq API key not found.")
-        provider_cls = ChatGroq
+        provider_cls = _provider_class(model_provider)
         kwargs = {"model_name": model_name, "api_key": SecretStr(api_key), "timeout": None}
         
     elif model_provider == ModelProvider.OPENAI:
         api_key = (api_keys or {}).get("OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OpenAI API key not found.")
-        provider_cls = ChatOpenAI
+        provider_cls = _provider_class(model_provider)
         kwargs = {"model": model_name, "api_key": SecretStr(api_key), "base_url": os.getenv("OPENAI_API_BASE")}
         
     elif model_provider == ModelProvider.ANTHROPIC:
         api_key = (api_keys or {}).get("ANTHROPIC_API_KEY") or os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError("Anthropic API key not found.")
-        provider_cls = ChatAnthropic
+        provider_cls = _provider_class(model_provider)
         kwargs = {"model_name": model_name, "api_key": SecretStr(api_key)}
         
     elif model_provider == ModelProvider.DEEPSEEK:
         api_key = (api_keys or {}).get("DEEPSEEK_API_KEY") or os.getenv("DEEPSEEK_API_KEY")
         if not api_key:
             raise ValueError("DeepSeek API key not found.")
-        provider_cls = ChatDeepSeek
+        provider_cls = _provider_class(model_provider)
         kwargs = {"model_name": model_name, "api_key": SecretStr(api_key)}
         
     elif model_provider == ModelProvider.GOOGLE:
         api_key = (api_keys or {}).get("GOOGLE_API_KEY") or os.getenv("GOOGLE_API_KEY")
         if not api_key:
             raise ValueError("Google API key not found.")
-        provider_cls = ChatGoogleGenerativeAI
+        provider_cls = _provider_class(model_provider)
         kwargs = {"model": model_name, "api_key": SecretStr(api_key)}
         
     elif model_provider == ModelProvider.OLLAMA:
         ollama_host = os.getenv("OLLAMA_HOST", "localhost")
-        provider_cls = ChatOllama
+        provider_cls = _provider_class(model_provider)
         kwargs = {"model": model_name, "base_url": os.getenv("OLLAMA_BASE_URL", f"http://{ollama_host}:11434")}
         
     elif model_provider == ModelProvider.OPENROUTER:
         api_key = (api_keys or {}).get("OPENROUTER_API_KEY") or os.getenv("OPENROUTER_API_KEY")
         if not api_key:
             raise ValueError("OpenRouter API key not found.")
-        provider_cls = ChatOpenAI
+        provider_cls = _provider_class(model_provider)
         kwargs = {
             "model": model_name,
             "api_key": SecretStr(api_key),
@@ -214,11 +284,11 @@ def get_model(model_name: str, model_provider: Union[ModelProvider, str], api_ke
         api_key = (api_keys or {}).get("XAI_API_KEY") or os.getenv("XAI_API_KEY")
         if not api_key:
             raise ValueError("xAI API key not found.")
-        provider_cls = ChatXAI
+        provider_cls = _provider_class(model_provider)
         kwargs = {"model": model_name, "api_key": SecretStr(api_key)}
         
     elif model_provider == ModelProvider.GIGACHAT:
-        provider_cls = GigaChat
+        provider_cls = _provider_class(model_provider)
         api_key = (api_keys or {}).get("GIGACHAT_API_KEY") or os.getenv("GIGACHAT_API_KEY") or os.getenv("GIGACHAT_CREDENTIALS")
         if os.getenv("GIGACHAT_USER") or os.getenv("GIGACHAT_PASSWORD"):
             kwargs = {"model": model_name}
@@ -228,7 +298,7 @@ def get_model(model_name: str, model_provider: Union[ModelProvider, str], api_ke
             raise ValueError("GigaChat credentials not found.")
             
     elif model_provider == ModelProvider.AZURE_OPENAI:
-        provider_cls = AzureChatOpenAI
+        provider_cls = _provider_class(model_provider)
         api_key = os.getenv("AZURE_OPENAI_API_KEY")
         if not api_key:
             raise ValueError("Azure OpenAI configuration not found.")
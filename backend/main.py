@@ -1,8 +1,11 @@
+import asyncio
 import logging
+import os
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import inspect
 
 # Load environment variables from root .env
 load_dotenv("../.env")
@@ -10,6 +13,8 @@ load_dotenv("../.env")
 from api import api_router
 from database.connection import engine
 from database.models import Base
+from database.partitions import roll_forward_partitions
+from llm.models import preload_model
 from services.ollama_service import ollama_service
 
 # Configure logging
@@ -18,8 +23,16 @@ logger = logging.getLogger(__name__)
 
 app = FastAPI(title="AI Hedge Fund API", description="Backend API for AI Hedge Fund", version="0.1.0")
 
+
+def _ensure_tables():
+    """Create missing tables; one table-name lookup skips the per-table DDL checks once the schema exists."""
+    if not set(Base.metadata.tables).issubset(inspect(engine).get_table_names()):
+        Base.metadata.create_all(bind=engine)
+
+
 # Initialize database tables (this is safe to run multiple times)
-Base.metadata.create_all(bind=engine)
+_ensure_tables()
+roll_forward_partitions(engine)
 
 # Configure CORS
 app.add_middleware(
@@ -34,12 +47,14 @@ app.add_middleware(
 app.include_router(api_router)
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Startup event to check Ollama availability."""
+OLLAMA_CHECK_TIMEOUT_S = 2.0
+
+
+async def _check_and_log_ollama():
+    """Check Ollama availability and log the result; bounded so it can never hang."""
     try:
         logger.info("Checking Ollama availability...")
-        status = await ollama_service.check_ollama_status()
+        status = await asyncio.wait_for(ollama_service.check_ollama_status(), timeout=OLLAMA_CHECK_TIMEOUT_S)
 
         if status["installed"]:
             if status["running"]:
@@ -55,6 +70,32 @@ async def startup_event():
             logger.info("ℹ Ollama is not installed. Install it to use local models.")
             logger.info("ℹ Visit https://ollama.com to download and install Ollama")
 
+    except asyncio.TimeoutError:
+        logger.warning(f"Ollama status check timed out after {OLLAMA_CHECK_TIMEOUT_S}s")
+        logger.info("ℹ Ollama integration is available if you install it later")
     except Exception as e:
         logger.warning(f"Could not check Ollama status: {e}")
         logger.info("ℹ Ollama integration is available if you install it later")
+
+
+async def _preload_llm():
+    """Build the configured default LLM up front so the first request doesn't pay for it."""
+    model_name = os.getenv("PRELOAD_LLM_MODEL")
+    model_provider = os.getenv("PRELOAD_LLM_PROVIDER")
+    app.state.preloaded_llm = None
+    if not (model_name and model_provider):
+        return
+
+    try:
+        app.state.preloaded_llm = await asyncio.to_thread(preload_model, model_name, model_provider)
+        logger.info(f"✓ Preloaded LLM {model_name} ({model_provider})")
+    except Exception as e:
+        logger.warning(f"Could not preload LLM {model_name} ({model_provider}): {e}")
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Startup event; the Ollama check runs in the background so it doesn't delay serving."""
+    # Keep a reference so the task isn't garbage-collected before it finishes
+    app.state.ollama_check_task = asyncio.create_task(_check_and_log_ollama())
+    await _preload_llm()
@@ -1,7 +1,18 @@
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to pydantic's JSON serializer
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def _sse_prefix(event_type: str) -> bytes:
+    return f"event: {event_type.lower()}\ndata: ".encode()
+
 
 class BaseEvent(BaseModel):
     """Base class for all Server-Sent Event events"""
@@ -9,10 +20,10 @@ class BaseEvent(BaseModel):
     type: str
     schema_version: str = "1.0"
 
-    def to_sse(self) -> str:
-        """Convert to Server-Sent Event format"""
-        event_type = self.type.lower()
-        return f"event: {event_type}\ndata: {self.model_dump_json()}\n\n"
+    def to_sse(self) -> bytes:
+        """Convert to a UTF-8 encoded Server-Sent Event frame"""
+        data = orjson.dumps(self.model_dump(mode="json")) if orjson is not None else self.model_dump_json().encode()
+        return _sse_prefix(self.type) + data + b"\n\n"
 
 
 class StartEvent(BaseEvent):
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import desc
+from sqlalchemy import String, desc, false, func, insert, literal, select
 from sqlalchemy.orm import Session
 
 from database.models import HedgeFundFlow
@@ -50,9 +50,18 @@ class FlowRepository:
             query = query.filter(HedgeFundFlow.is_template.is_(False))
         return query.order_by(desc(HedgeFundFlow.updated_at)).all()
 
-    def get_flows_by_name(self, name: str) -> List[HedgeFundFlow]:
-        """Search flows by name (case-insensitive partial match)"""
-        return self.db.query(HedgeFundFlow).filter(HedgeFundFlow.name.ilike(f"%{name}%")).order_by(desc(HedgeFundFlow.updated_at)).all()
+    def get_flows_by_name(self, name: str, limit: int = 100) -> List[HedgeFundFlow]:
+        """Search flows by name (case-insensitive partial match), exact name matches first"""
+        term = name.lower()
+        # Escape LIKE wildcards so names such as "mean_rev" match literally
+        pattern = "%" + name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return (
+            self.db.query(HedgeFundFlow)
+            .filter(HedgeFundFlow.name.ilike(pattern, escape="\\"))
+            .order_by((func.lower(HedgeFundFlow.name) == term).desc(), desc(HedgeFundFlow.updated_at))
+            .limit(limit)
+            .all()
+        )
 
     def update_flow(
         self, 
@@ -103,20 +112,24 @@ class FlowRepository:
         return True
 
     def duplicate_flow(self, flow_id: int, new_name: Optional[str] = None) -> Optional[HedgeFundFlow]:
-        """Create a copy of an existing flow"""
-        original = self.get_flow_by_id(flow_id)
-        if not original:
+        """Create a copy of an existing flow (copied server-side; JSON payloads never reach Python)"""
+        original_name = self.db.scalar(select(HedgeFundFlow.name).where(HedgeFundFlow.id == flow_id))
+        if original_name is None:
             return None
 
-        copy_name = new_name or f"{original.name} (Copy)"
-
-        return self.create_flow(
-            name=copy_name, 
-            description=str(original.description), 
-            nodes=list(original.nodes), 
-            edges=list(original.edges), 
-            viewport=dict(original.viewport) if original.viewport else None, 
-            data=dict(original.data) if original.data else None, 
-            is_template=False, 
-            tags=list(original.tags) if original.tags else None
-        )
+        copy_name = new_name or f"{original_name} (Copy)"
+
+        columns = ["name", "description", "nodes", "edges", "viewport", "data", "is_template", "tags"]
+        source = select(
+            literal(copy_name, String),
+            HedgeFundFlow.description,
+            HedgeFundFlow.nodes,
+            HedgeFundFlow.edges,
+            HedgeFundFlow.viewport,
+            HedgeFundFlow.data,
+            false(),
+            HedgeFundFlow.tags,
+        ).where(HedgeFundFlow.id == flow_id)
+        new_id = self.db.scalar(insert(HedgeFundFlow).from_select(columns, source).returning(HedgeFundFlow.id))
+        self.db.commit()
+        return self.get_flow_by_id(new_id)
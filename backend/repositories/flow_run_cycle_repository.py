@@ -0,0 +1,141 @@
+from datetime import datetime, UTC
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from database.models import CyclePerformanceSummary, HedgeFundFlowRunCycle
+from models.schemas import FlowRunStatus
+
+
+def _as_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _summary_fields(cycle: HedgeFundFlowRunCycle) -> Dict[str, Any]:
+    """Extract the flat summary columns from a cycle's JSON blobs"""
+    metrics = cycle.performance_metrics or {}
+    snapshot = cycle.portfolio_snapshot or {}
+    positions = snapshot.get("positions") or {}
+    equity = snapshot.get("portfolio_value", snapshot.get("equity", metrics.get("portfolio_value")))
+
+    return {
+        "flow_run_id": cycle.flow_run_id,
+        "cycle_number": cycle.cycle_number,
+        "completed_at": cycle.completed_at,
+        "pnl": _as_float(metrics.get("pnl", metrics.get("total_return"))),
+        "sharpe": _as_float(metrics.get("sharpe_ratio")),
+        "gross_exposure": _as_float(metrics.get("gross_exposure")),
+        "net_exposure": _as_float(metrics.get("net_exposure")),
+        "cash": _as_float(snapshot.get("cash", metrics.get("cash"))),
+        "equity": _as_float(equity),
+        "positions_count": len(positions),
+    }
+
+
+class FlowRunCycleRepository:
+    """Repository for HedgeFundFlowRunCycle writes and the derived performance summary"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create_cycle(self, flow_run_id: int, cycle_number: int, trigger_reason: Optional[str] = None) -> HedgeFundFlowRunCycle:
+        """Start a new analysis cycle"""
+        cycle = HedgeFundFlowRunCycle(
+            flow_run_id=flow_run_id,
+            cycle_number=cycle_number,
+            started_at=datetime.now(UTC),
+            trigger_reason=trigger_reason,
+            status=FlowRunStatus.IN_PROGRESS.value,
+        )
+        self.db.add(cycle)
+        self.db.commit()
+        self.db.refresh(cycle)
+        return cycle
+
+    def create_cycles_bulk(self, flow_run_id: int, cycles: List[Dict[str, Any]]) -> List[int]:
+        """Insert many cycles in one batched INSERT ... VALUES statement, returns the new IDs in input order"""
+        if not cycles:
+            return []
+
+        now = datetime.now(UTC)
+        rows = [
+            {"status": FlowRunStatus.IN_PROGRESS.value, "started_at": now, **cycle, "flow_run_id": flow_run_id}
+            for cycle in cycles
+        ]
+        ids = list(self.db.scalars(insert(HedgeFundFlowRunCycle).returning(HedgeFundFlowRunCycle.id, sort_by_parameter_order=True), rows))
+        self.db.commit()
+        return ids
+
+    def get_cycle_by_id(self, cycle_id: int) -> Optional[HedgeFundFlowRunCycle]:
+        """Get a cycle by its ID"""
+        return self.db.query(HedgeFundFlowRunCycle).filter(HedgeFundFlowRunCycle.id == cycle_id).first()
+
+    def complete_cycle(
+        self,
+        cycle_id: int,
+        analyst_signals: Optional[Dict[str, Any]] = None,
+        trading_decisions: Optional[Dict[str, Any]] = None,
+        executed_trades: Optional[List[Dict[str, Any]]] = None,
+        portfolio_snapshot: Optional[Dict[str, Any]] = None,
+        performance_metrics: Optional[Dict[str, Any]] = None,
+    ) -> Optional[HedgeFundFlowRunCycle]:
+        """Mark a cycle COMPLETE and refresh its summary row in the same transaction"""
+        cycle = self.get_cycle_by_id(cycle_id)
+        if not cycle:
+            return None
+
+        if analyst_signals is not None:
+            cycle.analyst_signals = analyst_signals
+        if trading_decisions is not None:
+            cycle.trading_decisions = trading_decisions
+        if executed_trades is not None:
+            cycle.executed_trades = executed_trades
+        if portfolio_snapshot is not None:
+            cycle.portfolio_snapshot = portfolio_snapshot
+        if performance_metrics is not None:
+            cycle.performance_metrics = performance_metrics
+
+        cycle.status = FlowRunStatus.COMPLETE.value
+        if cycle.completed_at is None:
+            cycle.completed_at = datetime.now(UTC)
+
+        self._upsert_summary(cycle)
+        self.db.commit()
+        self.db.refresh(cycle)
+        return cycle
+
+    def get_cycle_summaries(self, flow_run_id: int) -> List[CyclePerformanceSummary]:
+        """Get the summary rows for a run, ordered by cycle number"""
+        return (
+            self.db.query(CyclePerformanceSummary)
+            .filter(CyclePerformanceSummary.flow_run_id == flow_run_id)
+            .order_by(CyclePerformanceSummary.cycle_number)
+            .all()
+        )
+
+    def rebuild_summary(self, flow_run_id: int) -> int:
+        """Backfill the summary rows of every completed cycle in a run, returns the row count"""
+        self.db.query(CyclePerformanceSummary).filter(CyclePerformanceSummary.flow_run_id == flow_run_id).delete(synchronize_session=False)
+
+        cycles = (
+            self.db.query(HedgeFundFlowRunCycle)
+            .filter(HedgeFundFlowRunCycle.flow_run_id == flow_run_id, HedgeFundFlowRunCycle.status == FlowRunStatus.COMPLETE.value)
+            .all()
+        )
+        if cycles:
+            self.db.execute(insert(CyclePerformanceSummary), [{"cycle_id": cycle.id, **_summary_fields(cycle)} for cycle in cycles])
+        self.db.commit()
+        return len(cycles)
+
+    def _upsert_summary(self, cycle: HedgeFundFlowRunCycle) -> None:
+        fields = _summary_fields(cycle)
+        summary = self.db.query(CyclePerformanceSummary).filter(CyclePerformanceSummary.cycle_id == cycle.id).first()
+        if summary is None:
+            self.db.add(CyclePerformanceSummary(cycle_id=cycle.id, **fields))
+            return
+        for key, value in fields.items():
+            setattr(summary, key, value)
@@ -1,8 +1,8 @@
 from datetime import datetime, UTC
 from typing import Any, Dict, List, Optional, cast
 
-from sqlalchemy import desc, func
-from sqlalchemy.orm import Session
+from sqlalchemy import desc, func, select
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 from database.models import HedgeFundFlowRun
 from models.schemas import FlowRunStatus
@@ -29,6 +29,11 @@ class FlowRunRepository:
         """Get a flow run by its ID"""
         return self.db.query(HedgeFundFlowRun).filter(HedgeFundFlowRun.id == run_id).first()
 
+    def get_flow_run_with_cycles(self, run_id: int) -> Optional[HedgeFundFlowRun]:
+        """Get a flow run with its cycles eagerly loaded in one extra query"""
+        stmt = select(HedgeFundFlowRun).where(HedgeFundFlowRun.id == run_id).options(selectinload(HedgeFundFlowRun.cycles), raiseload("*"))
+        return self.db.scalars(stmt).first()
+
     def get_flow_runs_by_flow_id(self, flow_id: int, limit: int = 50, offset: int = 0) -> List[HedgeFundFlowRun]:
         """Get all runs for a specific flow, ordered by most recent first"""
         return self.db.query(HedgeFundFlowRun).filter(HedgeFundFlowRun.flow_id == flow_id).order_by(desc(HedgeFundFlowRun.created_at)).limit(limit).offset(offset).all()
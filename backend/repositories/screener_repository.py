@@ -0,0 +1,96 @@
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import desc, insert, text
+from sqlalchemy.orm import Session
+
+from database.connection import json_serializer
+from database.models import ScreenerRun
+
+
+_RUN_COLUMNS = ("market", "k", "base_count", "eligible_count", "selected_symbols", "ranking_data", "config", "weights")
+
+
+class ScreenerRunRepository:
+    """Repository for ScreenerRun writes and top-K reads (backed by the screener_top_k materialized view)"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @property
+    def _has_materialized_view(self) -> bool:
+        return self.db.get_bind().dialect.name == "postgresql"
+
+    def create_run(
+        self,
+        market: str,
+        k: int,
+        base_count: int,
+        eligible_count: int,
+        selected_symbols: List[str],
+        ranking_data: Dict[str, Any],
+        config: Optional[Dict[str, Any]] = None,
+        weights: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Persist a screener run as a Core insert (no ORM unit of work); JSON payloads go through the
+        engine's orjson serializer. On psycopg 3 the row is streamed with binary COPY instead.
+        """
+        values = (market, k, base_count, eligible_count, selected_symbols, ranking_data, config, weights)
+        dialect = self.db.get_bind().dialect
+        if dialect.name == "postgresql" and dialect.driver == "psycopg":
+            self._copy_run(values)
+        else:
+            self.db.execute(insert(ScreenerRun), [dict(zip(_RUN_COLUMNS, values))])
+        self.db.commit()
+
+    def _copy_run(self, values: tuple) -> None:
+        from psycopg.types.json import Json, Jsonb
+
+        market, k, base_count, eligible_count, selected_symbols, ranking_data, config, weights = values
+        dbapi_conn = self.db.connection().connection.dbapi_connection
+        with dbapi_conn.cursor() as cursor:
+            with cursor.copy(f"COPY screener_runs ({', '.join(_RUN_COLUMNS)}) FROM STDIN WITH (FORMAT BINARY)") as copy:
+                copy.set_types(["varchar", "int4", "int4", "int4", "json", "jsonb", "json", "json"])
+                copy.write_row(
+                    (
+                        market,
+                        k,
+                        base_count,
+                        eligible_count,
+                        Json(selected_symbols, dumps=json_serializer),
+                        Jsonb(ranking_data, dumps=json_serializer),
+                        Json(config, dumps=json_serializer),
+                        Json(weights, dumps=json_serializer),
+                    )
+                )
+
+    def refresh_top_k(self) -> None:
+        """Refresh the screener_top_k view after a new run is written (PostgreSQL only)"""
+        if not self._has_materialized_view:
+            return
+        self.db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY screener_top_k"))
+        self.db.commit()
+
+    def get_latest_top_k(self, market: str, k: int) -> List[Dict[str, Any]]:
+        """Get the top-k rows (symbol, rank, score, factors) of the latest run for a market"""
+        if self._has_materialized_view:
+            rows = self.db.execute(
+                text(
+                    "SELECT symbol, rank, score, factors FROM screener_top_k "
+                    "WHERE run_id = (SELECT run_id FROM screener_top_k WHERE market = :market ORDER BY created_at DESC LIMIT 1) "
+                    "ORDER BY rank LIMIT :k"
+                ),
+                {"market": market, "k": k},
+            ).mappings()
+            return [dict(row) for row in rows]
+
+        # Fallback for databases without materialized views: slice the latest run's JSON
+        run = self.db.query(ScreenerRun).filter(ScreenerRun.market == market).order_by(desc(ScreenerRun.created_at), desc(ScreenerRun.id)).first()
+        if not run:
+            return []
+
+        scores_table = (run.ranking_data or {}).get("scores_table", {})
+        return [
+            {"symbol": symbol, "rank": rank, "score": scores_table.get(symbol, {}).get("composite_score"), "factors": scores_table.get(symbol, {})}
+            for rank, symbol in enumerate(run.selected_symbols[:k], start=1)
+        ]
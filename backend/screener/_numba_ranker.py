@@ -0,0 +1,60 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; ranker falls back to the NumPy version
+    njit = None
+
+
+def _quantile(v: np.ndarray, q: float) -> float:
+    # Linear interpolation between order statistics, as np.nanquantile's default method.
+    # A partial sort (select) places the lower neighbour; the upper one is the minimum to its right.
+    pos = q * (v.shape[0] - 1)
+    k = int(np.floor(pos))
+    part = np.partition(v, k)
+    a = part[k]
+    b = part[k + 1:].min() if k + 1 < v.shape[0] else a
+    t = pos - k
+    if t >= 0.5:
+        return b - (b - a) * (1.0 - t)
+    return a + (b - a) * t
+
+
+def _winsor_zscore_loop(arr: np.ndarray, lower: float, upper: float) -> np.ndarray:
+    # Same result as ranker._rank_matrix up to rounding, one column per parallel iteration
+    n_rows, n_cols = arr.shape
+    out = np.zeros((n_rows, n_cols), dtype=np.float64)
+    for j in prange(n_cols):
+        col = arr[:, j]
+        valid = col[~np.isnan(col)]
+        n = valid.shape[0]
+        if n < 2:
+            continue
+        lo = _quantile(valid, lower)
+        hi = _quantile(valid, upper)
+
+        # Fused pass: clip and accumulate Welford mean/M2 together
+        mean = 0.0
+        m2 = 0.0
+        for i in range(n):
+            x = min(max(valid[i], lo), hi)
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+        sd = np.sqrt(m2 / (n - 1))
+        if sd == 0:
+            continue
+
+        for i in range(n_rows):
+            x = col[i]
+            if not np.isnan(x):
+                out[i, j] = (min(max(x, lo), hi) - mean) / sd
+    return out
+
+
+if njit is not None:
+    _quantile = njit(cache=True)(_quantile)
+    # Compiled lazily on the first large universe: a parallel compile at import would slow every startup
+    winsor_zscore = njit(parallel=True, cache=True)(_winsor_zscore_loop)
+else:
+    winsor_zscore = None
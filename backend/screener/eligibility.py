@@ -1,4 +1,5 @@
 from typing import List, Optional
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel
 
@@ -12,17 +13,17 @@ def filter_eligible(symbols: List[str], snapshot_df: pd.DataFrame, config: Eligi
     """
     Filters symbols based on tradability and liquidity criteria.
     """
-    df = snapshot_df.copy()
-    
-    # Apply filters
-    mask = df["price"] >= config.min_price
-    mask &= df["avg_dollar_volume"] >= config.min_adv
+    # Read-only: build the mask straight from the snapshot's column arrays
+    conditions = [
+        snapshot_df["price"].to_numpy() >= config.min_price,
+        snapshot_df["avg_dollar_volume"].to_numpy() >= config.min_adv,
+    ]
     
     if config.min_mcap:
-        mask &= df["market_cap"] >= config.min_mcap
+        conditions.append(snapshot_df["market_cap"].to_numpy() >= config.min_mcap)
         
-    if config.exclude_etfs and "is_etf" in df.columns:
-        mask &= ~df["is_etf"]
+    if config.exclude_etfs and "is_etf" in snapshot_df.columns:
+        conditions.append(~snapshot_df["is_etf"].to_numpy(dtype=bool))
         
-    eligible_df = df[mask]
-    return eligible_df.index.tolist()
+    mask = np.logical_and.reduce(conditions)
+    return snapshot_df.index[mask].tolist()
@@ -1,19 +1,43 @@
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+import numpy as np
 from data.universe_provider import get_base_universe
-from data.market_data import get_snapshot, get_history
+from data.market_data import get_cached_snapshot, get_history
 from screener.eligibility import filter_eligible, EligibilityConfig
 from screener.factors import compute_factor_frame
 from screener.ranker import get_ranking_result, RankingResult
 
+# Single worker: background writes land in run order and the MV refreshes never overlap
+_PERSIST_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screener-persist")
+
+def _persist_run(run: Dict[str, Any], db = None) -> None:
+    """Writes a screener run and refreshes the top-K view; failures are logged, never raised."""
+    try:
+        from database.connection import SessionLocal
+        from repositories.screener_repository import ScreenerRunRepository
+        
+        session = db or SessionLocal()
+        try:
+            repository = ScreenerRunRepository(session)
+            repository.create_run(**run)
+            repository.refresh_top_k()
+        finally:
+            if not db: session.close()
+    except Exception as e:
+        print(f"Warning: Failed to persist screener run: {e}")
+
 def run_screener(
     market: str = "US",
     k: int = 50,
     config: Optional[EligibilityConfig] = None,
     weights: Optional[Dict[str, float]] = None,
-    db = None
+    db = None,
+    background: bool = False
 ) -> RankingResult:
     """
     Runs the full screening and ranking pipeline and persists results.
+    With background=True (and no caller-owned `db`) the write is handed to a worker thread
+    and the result is returned without waiting on the database.
     """
     if config is None:
         config = EligibilityConfig()
@@ -33,8 +57,8 @@ def run_screener(
     # 1. Get Base Universe
     base_symbols = get_base_universe(market)
     
-    # 2. Batch Data Fetch
-    snapshot_df = get_snapshot(base_symbols)
+    # 2. Batch Data Fetch (served from cache, refreshed in the background when stale)
+    snapshot_df = get_cached_snapshot(market.upper(), base_symbols)
     
     # 3. Eligibility Filter
     eligible_symbols = filter_eligible(base_symbols, snapshot_df, config)
@@ -48,8 +72,8 @@ def run_screener(
             scores_table={}
         )
 
-    # 4. History Data for Factors
-    history_df = get_history(eligible_symbols, lookback_days=300)
+    # 4. History Data for Factors (FP32 halves the working set; ranking is precision-insensitive)
+    history_df = get_history(eligible_symbols, lookback_days=300, dtype=np.float32)
     
     # 5. Compute Factors
     factor_df = compute_factor_frame(eligible_symbols, snapshot_df.loc[eligible_symbols], history_df)
@@ -64,25 +88,20 @@ def run_screener(
     )
     
     # 7. Persistence (Move 1: Ranking as a Contract)
-    try:
-        from database.connection import SessionLocal
-        from database.models import ScreenerRun
-        
-        session = db or SessionLocal()
-        run_record = ScreenerRun(
-            market=market,
-            k=k,
-            base_count=result.base_count,
-            eligible_count=result.eligible_count,
-            selected_symbols=result.top_k_symbols,
-            ranking_data=result.model_dump(),
-            config=config.model_dump(),
-            weights=weights
-        )
-        session.add(run_record)
-        session.commit()
-        if not db: session.close()
-    except Exception as e:
-        print(f"Warning: Failed to persist screener run: {e}")
+    run = {
+        "market": market,
+        "k": k,
+        "base_count": result.base_count,
+        "eligible_count": result.eligible_count,
+        "selected_symbols": result.top_k_symbols,
+        # The columnar table is an API view of scores_table; the stored contract stays row-oriented
+        "ranking_data": result.model_dump(exclude={"scores_table_columnar"}),
+        "config": config.model_dump(),
+        "weights": dict(weights),
+    }
+    if background and db is None:
+        _PERSIST_POOL.submit(_persist_run, run)
+    else:
+        _persist_run(run, db)
     
     return result
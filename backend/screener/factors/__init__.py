@@ -1,20 +1,26 @@
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from .momentum import compute_momentum_12_1, compute_momentum_6m
 from .risk import compute_volatility_20d, compute_momentum_vol_ratio
 from .fundamentals import compute_earnings_yield, compute_fcf_yield
 
+# The time-series factors only read history_df and spend their time in NumPy kernels that
+# release the GIL, so they run side by side on a small shared pool
+_FACTOR_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="screener-factors")
+
 def compute_factor_frame(symbols: list, snapshot_df: pd.DataFrame, history_df: pd.DataFrame) -> pd.DataFrame:
     """
     Computes all factors for the given symbols.
     """
     factors = {}
     
-    # B: Momentum
-    factors["momentum_12_1"] = compute_momentum_12_1(history_df)
-    factors["momentum_6m"] = compute_momentum_6m(history_df)
-    
-    # C: Risk
-    factors["volatility_20d"] = compute_volatility_20d(history_df)
+    # B: Momentum, C: Risk (independent reductions over the same history)
+    mom_12_1 = _FACTOR_POOL.submit(compute_momentum_12_1, history_df)
+    mom_6m = _FACTOR_POOL.submit(compute_momentum_6m, history_df)
+    vol_20d = _FACTOR_POOL.submit(compute_volatility_20d, history_df)
+    factors["momentum_12_1"] = mom_12_1.result()
+    factors["momentum_6m"] = mom_6m.result()
+    factors["volatility_20d"] = vol_20d.result()
     factors["mom_vol_ratio"] = compute_momentum_vol_ratio(factors["momentum_12_1"], factors["volatility_20d"])
     
     # A: Fundamentals (proxies)
@@ -6,12 +6,14 @@ def compute_momentum_12_1(history_df: pd.DataFrame) -> pd.Series:
     if len(history_df) < 252:
         return pd.Series(0.0, index=history_df.columns)
     
-    # Approx trading days
-    return (history_df.iloc[-21] / history_df.iloc[-252]) - 1
+    # Approx trading days; raw row slices skip the per-row Series and index alignment
+    arr = history_df.to_numpy()
+    return pd.Series(arr[-21] / arr[-252] - 1, index=history_df.columns)
 
 def compute_momentum_6m(history_df: pd.DataFrame) -> pd.Series:
     """6m momentum."""
     if len(history_df) < 126:
         return pd.Series(0.0, index=history_df.columns)
     
-    return (history_df.iloc[-1] / history_df.iloc[-126]) - 1
+    arr = history_df.to_numpy()
+    return pd.Series(arr[-1] / arr[-126] - 1, index=history_df.columns)
@@ -3,6 +3,13 @@ import numpy as np
 
 def compute_volatility_20d(history_df: pd.DataFrame) -> pd.Series:
     """20d volatility."""
+    # Fast path: only the last 21 prices matter when they are complete
+    window = history_df.to_numpy()[-21:]
+    if len(window) == 21 and not np.isnan(window).any():
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = window[1:] / window[:-1] - 1
+        return pd.Series(returns.std(axis=0, ddof=1) * np.sqrt(252), index=history_df.columns)
+
     returns = history_df.pct_change().dropna()
     return returns.tail(20).std() * np.sqrt(252)
 
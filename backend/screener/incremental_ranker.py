@@ -0,0 +1,87 @@
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class IncrementalCrossSectionRanker:
+    """
+    Rolling-window variant of `rank_cross_section` for backtests that rebalance daily.
+
+    Each `update` reduces one day's cross-section to per-factor aggregates (winsor thresholds,
+    count, mean, M2) and drops the day that left the window, so a rebalance costs O(N_universe)
+    instead of re-reducing N_universe x window values. `snapshot` z-scores the latest day
+    against the pooled window statistics (Chan/Welford merge of the daily aggregates).
+
+    Winsor thresholds are the window average of each day's 1%/99% quantiles, a cheap sketch
+    in place of an exact pooled quantile. With window=1 the result equals `rank_cross_section`.
+    """
+
+    def __init__(self, window: int, lower: float = 0.01, upper: float = 0.99):
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        self.window = window
+        self.lower = lower
+        self.upper = upper
+        self._days: Deque[Tuple[np.ndarray, ...]] = deque(maxlen=window)
+        self._latest: Optional[pd.DataFrame] = None
+
+    def update(self, day_slice: pd.DataFrame) -> None:
+        """Add one day's (symbols x factors) cross-section; the oldest day leaves the window."""
+        if self._latest is not None and list(day_slice.columns) != list(self._latest.columns):
+            raise ValueError("factor columns changed; start a new ranker")
+
+        arr = day_slice.to_numpy(dtype=np.float64)
+        n = np.count_nonzero(~np.isnan(arr), axis=0)
+        lo = np.full(arr.shape[1], np.nan)
+        hi = np.full(arr.shape[1], np.nan)
+        mean = np.zeros(arr.shape[1])
+        m2 = np.zeros(arr.shape[1])
+
+        live = n > 0
+        if live.any():
+            x = arr[:, live]
+            lo[live], hi[live] = np.nanquantile(x, [self.lower, self.upper], axis=0)
+            x = np.clip(x, lo[live], hi[live])
+            mean[live] = np.nansum(x, axis=0) / n[live]
+            m2[live] = np.nansum((x - mean[live]) ** 2, axis=0)
+
+        self._days.append((n, lo, hi, mean, m2))
+        self._latest = day_slice
+
+    def _pooled(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        n_cols = self._days[0][0].shape[0]
+        count = np.zeros(n_cols)
+        mean = np.zeros(n_cols)
+        m2 = np.zeros(n_cols)
+        lo_sum = np.zeros(n_cols)
+        hi_sum = np.zeros(n_cols)
+        days = np.zeros(n_cols)
+        for n_b, lo_b, hi_b, mean_b, m2_b in self._days:
+            # Chan et al. parallel merge of (count, mean, M2)
+            total = count + n_b
+            safe = np.where(total > 0, total, 1)
+            delta = mean_b - mean
+            mean = mean + delta * n_b / safe
+            m2 = m2 + m2_b + delta * delta * count * n_b / safe
+            count = total
+            has = n_b > 0
+            lo_sum[has] += lo_b[has]
+            hi_sum[has] += hi_b[has]
+            days += has
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return count, mean, m2, lo_sum / days, hi_sum / days
+
+    def snapshot(self) -> pd.DataFrame:
+        """Z-scores of the latest day against the window; missing and degenerate factors score 0."""
+        if self._latest is None:
+            return pd.DataFrame()
+
+        count, mean, m2, lo, hi = self._pooled()
+        sd = np.sqrt(m2 / np.maximum(count - 1, 1))  # ddof=1, as pandas .std()
+        arr = self._latest.to_numpy(dtype=np.float64)
+        with np.errstate(invalid="ignore"):
+            z = (np.clip(arr, lo, hi) - mean) / np.where((count > 1) & (sd != 0), sd, np.inf)
+        z[np.isnan(z)] = 0.0
+        return pd.DataFrame(z, index=self._latest.index, columns=self._latest.columns)
@@ -1,7 +1,17 @@
+import threading
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, cast
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, cast
 from pydantic import BaseModel
-import math
+
+from screener._numba_ranker import winsor_zscore
+
+# Above this many symbols the compiled per-column kernel beats the NumPy reductions
+_NUMBA_MIN_ROWS = 2000
+# Below this many symbols, process start-up and pickling cost more than ranking the buckets inline
+_SECTOR_POOL_MIN_ROWS = 20000
 
 class RankingResult(BaseModel):
     base_count: int
@@ -9,51 +19,130 @@ class RankingResult(BaseModel):
     ranked_count: int
     top_k_symbols: List[str]
     scores_table: Dict[str, Dict[str, float]] # symbol -> {factor: score}
+    # Same scores column-wise (factor -> values in top_k_symbols order); serializes as flat float lists
+    scores_table_columnar: Dict[str, List[float]] = {}
+
+def _winsorize_np(a: np.ndarray, lower: float = 0.01, upper: float = 0.99) -> np.ndarray:
+    """Clip each column (or a 1-D array) to its [lower, upper] quantiles; NaNs are ignored and kept."""
+    lo, hi = np.nanquantile(a, [lower, upper], axis=0)
+    return np.clip(a, lo, hi)
+
+def _zscore_np(a: np.ndarray) -> np.ndarray:
+    """NaN-aware z-score along axis 0 (ddof=1); constant columns score 0, single values stay NaN."""
+    n = np.count_nonzero(~np.isnan(a), axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dev = a - np.nansum(a, axis=0) / n
+        sd = np.sqrt(np.nansum(dev * dev, axis=0) / (n - 1))  # ddof=1, as pandas .std()
+        return np.where(sd == 0, 0.0, dev / sd)
 
 def winsorize(s: pd.Series, lower: float = 0.01, upper: float = 0.99) -> pd.Series:
     """Winsorize extreme values."""
-    quantiles = s.quantile([lower, upper])
-    return s.clip(lower=float(quantiles.iloc[0]), upper=float(quantiles.iloc[1]))
+    return pd.Series(_winsorize_np(s.to_numpy(dtype=np.float64), lower, upper), index=s.index)
 
 def zscore(s: pd.Series) -> pd.Series:
     """Compute z-score."""
-    std = float(s.std())
-    if std == 0:
-        return pd.Series(0.0, index=s.index)
-    return (s - float(s.mean())) / std
+    return pd.Series(_zscore_np(s.to_numpy(dtype=np.float64)), index=s.index)
+
+def _rank_matrix(arr: np.ndarray) -> np.ndarray:
+    """Winsorized z-scores of a (symbols x factors) float64 matrix; see `rank_cross_section`."""
+    if winsor_zscore is not None and arr.shape[0] > _NUMBA_MIN_ROWS:
+        return winsor_zscore(np.ascontiguousarray(arr), 0.01, 0.99)
+
+    ranked = np.zeros_like(arr)
+
+    # One bulk count decides which factors have data; all-NaN factors stay zero
+    live = np.count_nonzero(~np.isnan(arr), axis=0) > 0
+    if live.any():
+        z = _zscore_np(_winsorize_np(arr[:, live]))
+        # Missing values and single-value (undefined std) columns -> z-score 0
+        z[np.isnan(z)] = 0.0
+        ranked[:, live] = z
 
-def rank_cross_section(df: pd.DataFrame) -> pd.DataFrame:
+    return ranked
+
+_SECTOR_POOL: Optional[ProcessPoolExecutor] = None
+_SECTOR_POOL_LOCK = threading.Lock()
+
+def _sector_pool() -> ProcessPoolExecutor:
+    # Created on first use: most callers rank the full universe and never need worker processes
+    global _SECTOR_POOL
+    with _SECTOR_POOL_LOCK:
+        if _SECTOR_POOL is None:
+            _SECTOR_POOL = ProcessPoolExecutor()
+        return _SECTOR_POOL
+
+def rank_cross_section(df: pd.DataFrame, group_col: Optional[str] = None) -> pd.DataFrame:
     """
     Winsorize and z-score all factors.
+    Vectorized over the whole factor matrix; equivalent to `zscore(winsorize(col.dropna()))`
+    per column, with missing values and empty/constant/single-value columns scored 0.
+
+    With `group_col` (e.g. a sector column) each bucket is ranked on its own; large universes
+    spread the buckets over worker processes. The group column is not part of the result.
     """
-    ranked_df = pd.DataFrame(index=df.index)
-    for col in df.columns:
-        s = df[col].dropna()
-        if s.empty:
-            ranked_df[col] = 0.0
-            continue
-        s_winsorized = winsorize(s)
-        ranked_df[col] = zscore(s_winsorized)
-    
-    return ranked_df.fillna(0.0)
+    if group_col is None:
+        ranked = _rank_matrix(df.to_numpy(dtype=np.float64))
+        return pd.DataFrame(ranked, index=df.index, columns=df.columns)
+
+    factors = df.drop(columns=[group_col])
+    arr = factors.to_numpy(dtype=np.float64)
+    positions = list(df.groupby(group_col, sort=False, dropna=False).indices.values())
+    # Workers only receive plain float matrices, which pickle cheaply
+    blocks = [arr[rows] for rows in positions]
+    if len(blocks) > 1 and len(arr) >= _SECTOR_POOL_MIN_ROWS:
+        results = _sector_pool().map(_rank_matrix, blocks)
+    else:
+        results = map(_rank_matrix, blocks)
+
+    ranked = np.zeros_like(arr)
+    for rows, block in zip(positions, results):
+        ranked[rows] = block
+    return pd.DataFrame(ranked, index=df.index, columns=factors.columns)
+
+@lru_cache(maxsize=64)
+def _signed_weight_vector(cols: Tuple[str, ...], weights_items: Tuple[Tuple[str, float], ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Column positions of the weighted factors present in `cols` (in weights order) and their
+    sign-corrected weights. Cached: the column set and weights rarely change between rebalances.
+    """
+    # Directionality: For now assume all factors are "higher is better"
+    # except volatility where "lower is better" (we flip the sign of its weight)
+    positions = {col: i for i, col in enumerate(cols)}
+    present = [(positions[factor], weight) for factor, weight in weights_items if factor in positions]
+    idx = np.array([i for i, _ in present], dtype=np.intp)
+    w = np.array([weight * (-1.0 if cols[i] == "volatility_20d" else 1.0) for i, weight in present], dtype=np.float64)
+    idx.flags.writeable = False
+    w.flags.writeable = False
+    return idx, w
+
+def _composite_matrix(ranked: np.ndarray, cols: Tuple[str, ...], weights: Dict[str, float]) -> np.ndarray:
+    idx, w = _signed_weight_vector(cols, tuple(weights.items()))
+    if not len(idx):
+        return np.zeros(ranked.shape[0], dtype=np.float64)
+    return ranked[:, idx] @ w
 
 def compute_composite_score(df_ranked: pd.DataFrame, weights: Dict[str, float]) -> pd.Series:
     """
     Computes a weighted sum of ranked factors.
     """
-    composite = pd.Series(0.0, index=df_ranked.index)
-    
-    # Directionality: For now assume all factors are "higher is better" 
-    # except volatility where "lower is better" (we'll flip sign if needed)
-    
-    for factor, weight in weights.items():
-        if factor in df_ranked.columns:
-            val = df_ranked[factor]
-            if factor == "volatility_20d": # Higher vol is worse
-                val = -val
-            composite += val * weight
-            
-    return composite
+    composite = _composite_matrix(df_ranked.to_numpy(dtype=np.float64), tuple(df_ranked.columns), weights)
+    return pd.Series(composite, index=df_ranked.index)
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the k highest scores, best first. O(N) partition plus an O(k log k) sort
+    of the winners instead of sorting the whole cross-section; NaNs rank last.
+    """
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    neg = -scores
+    if k < n:
+        idx = np.argpartition(neg, k - 1)[:k]
+        idx.sort()  # positional order first so ties keep a stable, input-ordered result
+    else:
+        idx = np.arange(n)
+    return idx[np.argsort(neg[idx], kind="stable")]
 
 def get_ranking_result(
     base_count: int,
@@ -65,36 +154,34 @@ def get_ranking_result(
     """
     Orchestrates the ranking process and returns a RankingResult.
     """
+    # Ranking stays in NumPy (symbols x factors); nothing is materialized per symbol until the top-K table
+    cols = tuple(factor_df.columns)
+
     # 1. Rank cross-section
-    df_ranked = rank_cross_section(factor_df)
-    
+    ranked = _rank_matrix(factor_df.to_numpy(dtype=np.float64))
+
     # 2. Compute composite score
-    composite_scores = compute_composite_score(df_ranked, weights)
-    df_ranked["composite_score"] = composite_scores
-    
+    composite = _composite_matrix(ranked, cols, weights)
+
     # 3. Select Top K
-    top_k = [str(s) for s in composite_scores.sort_values(ascending=False).head(k).index.tolist()]
-    
+    top_k_idx = top_k_indices(composite, k)
+    top_k = [str(s) for s in factor_df.index[top_k_idx]]
+
     # 4. Prepare scores table for Top K
-    top_k_df = df_ranked.loc[top_k]
-    
-    final_scores_table: Dict[str, Dict[str, float]] = {}
-    
-    for symbol_idx, row in top_k_df.iterrows():
-        symbol_str = str(symbol_idx)
-        factor_scores: Dict[str, float] = {}
-        for factor_name, score_val in row.items():
-            # Institutional Guardrail: Ensure all scores are finite
-            f_val = float(score_val)
-            if not math.isfinite(f_val):
-                f_val = 0.0 # Coerce to zero to prevent downstream pollution
-            factor_scores[str(factor_name)] = f_val
-        final_scores_table[symbol_str] = factor_scores
-    
+    top_k_values = np.column_stack([ranked[top_k_idx], composite[top_k_idx]])
+    # Institutional Guardrail: Ensure all scores are finite (coerce to zero to prevent downstream pollution)
+    top_k_values[~np.isfinite(top_k_values)] = 0.0
+    factor_names = [str(c) for c in cols] + ["composite_score"]
+    final_scores_table: Dict[str, Dict[str, float]] = {
+        symbol: dict(zip(factor_names, row)) for symbol, row in zip(top_k, top_k_values.tolist())
+    }
+    scores_table_columnar = dict(zip(factor_names, top_k_values.T.tolist()))
+
     return RankingResult(
         base_count=base_count,
         eligible_count=len(eligible_symbols),
         ranked_count=len(factor_df),
         top_k_symbols=top_k,
-        scores_table=final_scores_table
+        scores_table=final_scores_table,
+        scores_table_columnar=scores_table_columnar,
     )
\ No newline at end of file
@@ -2,11 +2,27 @@ import os
 import uuid
 from typing import Any, Dict, List, Optional
 
+from pydantic import TypeAdapter
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from database.models import ProposedTrade
 from services.trading.alpaca import AlpacaLiveProvider, AlpacaPaperProvider
-from services.trading.base import OrderSide, OrderType
+from services.trading.base import OrderSide, OrderType, Position
+
+# Compiled once; serializes a whole position list in one call
+_positions_adapter = TypeAdapter(List[Position])
+
+# Columns handed back by propose_trades_bulk
+_PROPOSED_TRADE_COLUMNS = (
+    ProposedTrade.id,
+    ProposedTrade.ticker,
+    ProposedTrade.action,
+    ProposedTrade.quantity,
+    ProposedTrade.status,
+    ProposedTrade.approval_token,
+    ProposedTrade.flow_run_id,
+)
 
 
 class BrokerageService:
@@ -42,6 +58,24 @@ class BrokerageService:
 
         return trade
 
+    def propose_trades_bulk(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Creates many PENDING ProposedTrades (e.g. a whole top-K rebalance) in one INSERT ... RETURNING
+        and a single commit. Each row needs ticker, action and quantity; persona_logic and flow_run_id are optional.
+        Returns plain dicts (in input order) so reading them after the commit issues no per-row refresh.
+        """
+        if not rows:
+            return []
+
+        values = [
+            {"persona_logic": None, "flow_run_id": None, **row, "action": row["action"].upper(), "status": "PENDING", "approval_token": str(uuid.uuid4())}
+            for row in rows
+        ]
+        stmt = insert(ProposedTrade).returning(*_PROPOSED_TRADE_COLUMNS, sort_by_parameter_order=True)
+        trades = [dict(row) for row in self.db.execute(stmt, values).mappings()]
+        self.db.commit()
+        return trades
+
     def execute_trade_by_token(self, token: str) -> Dict[str, Any]:
         """
         Executes the trade if the token is valid and status is PENDING.
@@ -83,4 +117,4 @@ class BrokerageService:
         if not self.provider:
             return []
         positions = self.provider.get_positions()
-        return [p.model_dump() for p in positions]
+        return _positions_adapter.dump_python(positions, mode="python")
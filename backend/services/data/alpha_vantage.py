@@ -1,10 +1,16 @@
+import asyncio
+import copy
 import os
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any, cast
+from typing import Dict, List, Optional, Any, Tuple, cast
 
-import requests
+import httpx
+import numpy as np
+import pandas as pd
 
 from data.cache import get_cache
 from data.models import (
@@ -14,96 +20,317 @@ from data.models import (
     LineItem,
     Price,
 )
-from services.data.data_service import DataService
+from services.data.data_service import DataService, line_items_adapter, loads_json, metrics_adapter, news_adapter, pooled_session, prices_adapter
+
+
+# Alpha Vantage daily series fields, in Price field order (open, high, low, close, volume)
+_PRICE_COLUMNS = ("1. open", "2. high", "3. low", "4. close", "6. volume")
+
+
+# The three statement calls of search_line_items are issued together: each still waits for its own
+# start slot, but one response's decode overlaps the next call's throttle wait
+_STATEMENT_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="alpha-vantage-statements")
+
+# LineItem field -> Alpha Vantage report key; values convert through _report_float
+_INC_FIELDS = (
+    ("revenue", "totalRevenue"),
+    ("net_income", "netIncome"),
+    ("depreciation_and_amortization", "depreciationAndAmortization"),
+    ("research_and_development", "researchAndDevelopment"),
+    ("interest_expense", "interestExpense"),
+    ("ebitda", "ebitda"),
+    ("ebit", "ebit"),
+)
+_BS_FIELDS = (
+    ("total_assets", "totalAssets"),
+    ("total_liabilities", "totalLiabilities"),
+    ("total_current_assets", "totalCurrentAssets"),
+    ("total_current_liabilities", "totalCurrentLiabilities"),
+    ("shareholders_equity", "totalShareholderEquity"),
+    ("long_term_debt", "longTermDebt"),
+    ("short_term_debt", "shortTermDebt"),
+    ("outstanding_shares", "commonStockSharesOutstanding"),
+)
+
+# FinancialMetrics growth fields filled from consecutive periods in get_financial_metrics
+_GROWTH_FIELDS = (
+    "earnings_per_share_growth",
+    "revenue_growth",
+    "earnings_growth",
+    "free_cash_flow_growth",
+    "operating_income_growth",
+    "ebitda_growth",
+    "book_value_growth",
+)
+
+
+def _report_float(value: Any) -> float:
+    """Statement value as float; Alpha Vantage reports missing numbers as the string "None"."""
+    return float(value) if value and value != "None" else 0.0
+
+
+def _parse_published(value: str) -> datetime:
+    """NEWS_SENTIMENT time_published (YYYYMMDDTHHMMSS) by integer slicing; strptime only for odd shapes."""
+    if len(value) == 15 and value[8] == "T" and value[:8].isdigit() and value[9:].isdigit():
+        return datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]), int(value[9:11]), int(value[11:13]), int(value[13:15]))
+    return datetime.strptime(value, "%Y%m%dT%H%M%S")
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
 
 
 class AlphaVantageService(DataService):
     """Implementation of DataService using Alpha Vantage."""
 
-    # Class-level lock to ensure only one thread hits the API at a time
-    _api_lock = threading.Lock()
-    # Track the last time we made an API call
-    _last_call_time = 0.0
+    # Minimum spacing between request starts (5 calls per minute). Callers reserve a start slot
+    # under a short lock and wait outside it, so network time overlaps instead of serializing.
+    _MIN_INTERVAL_S = 12.0
+    _schedule_lock = threading.Lock()
+    _next_slot = 0.0
+
+    # Process-level memo of successful responses: (function, symbol, kwargs) -> (fetched_at, data).
+    # OVERVIEW in particular is requested by both get_market_cap and get_financial_metrics.
+    _MEMO_TTL_S = 300.0
+    _MEMO_MAX_ENTRIES = 512
+    _memo: "OrderedDict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _memo_lock = threading.Lock()
+
+    # In-process tier in front of self.cache, keyed like it: (category, cache_key) -> parsed models.
+    # Repeat lookups of the same ticker/dates in a run skip the SQLite read and the model rebuild.
+    # Entries are written through alongside every self.cache write; the models are shared, so
+    # callers must not mutate them.
+    _RESULTS_MAX_ENTRIES = 1024
+    _results: "OrderedDict[Tuple[str, str], List[Any]]" = OrderedDict()
+    _results_lock = threading.Lock()
 
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.environ.get("ALPHA_VANTAGE_API_KEY")
         self.base_url = "https://www.alphavantage.co/query"
         self.cache = get_cache()
+        self._session = pooled_session()
 
-    def _make_request(self, function: str, symbol: Optional[str] = None, max_retries: int = 3, **kwargs) -> Dict[str, Any]:
+    def close(self) -> None:
+        """Release the pooled connections."""
+        self._session.close()
+
+    @classmethod
+    def _reserve_slot(cls, delay: float = 0.0) -> float:
+        """Reserve the next request start time (time.monotonic) at least `delay` seconds from now."""
+        with cls._schedule_lock:
+            slot = max(time.monotonic() + delay, AlphaVantageService._next_slot)
+            AlphaVantageService._next_slot = slot + cls._MIN_INTERVAL_S
+            return slot
+
+    def _params(self, function: str, symbol: Optional[str], kwargs: Dict[str, Any]) -> Dict[str, Any]:
         params = {"function": function, "apikey": self.api_key, **kwargs}
         if symbol:
             params["symbol"] = symbol
+        return params
+
+    @staticmethod
+    def _memo_key(function: str, symbol: Optional[str], kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (function, symbol, tuple(sorted(kwargs.items())))
+
+    @classmethod
+    def _memo_get(cls, key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        with cls._memo_lock:
+            entry = cls._memo.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > cls._MEMO_TTL_S:
+                del cls._memo[key]
+                return None
+            cls._memo.move_to_end(key)
+        # Callers get their own copy so the cached payload can't be mutated
+        return copy.deepcopy(entry[1])
+
+    @classmethod
+    def _memo_put(cls, key: Tuple[Any, ...], data: Dict[str, Any]) -> None:
+        if not data:
+            return
+        with cls._memo_lock:
+            cls._memo[key] = (time.monotonic(), copy.deepcopy(data))
+            cls._memo.move_to_end(key)
+            while len(cls._memo) > cls._MEMO_MAX_ENTRIES:
+                cls._memo.popitem(last=False)
+
+    @classmethod
+    def _result_get(cls, category: str, key: str) -> Optional[List[Any]]:
+        with cls._results_lock:
+            entry = cls._results.get((category, key))
+            if entry is None:
+                return None
+            cls._results.move_to_end((category, key))
+        return list(entry)
+
+    @classmethod
+    def _result_put(cls, category: str, key: str, items: List[Any]) -> None:
+        if not items:
+            return
+        with cls._results_lock:
+            cls._results[(category, key)] = list(items)
+            cls._results.move_to_end((category, key))
+            while len(cls._results) > cls._RESULTS_MAX_ENTRIES:
+                cls._results.popitem(last=False)
+
+    @staticmethod
+    def _check_payload(data: Dict[str, Any], attempt: int) -> Tuple[Optional[Dict[str, Any]], float]:
+        """Returns (result, 0) when done, or (None, backoff seconds) when the call should be retried."""
+        if "Error Message" in data:
+            print(f"Alpha Vantage Error: {data['Error Message']}")
+            return {}, 0.0
+
+        if "Note" in data:  # Rate limit hit
+            print(f"Alpha Vantage Rate Limit: {data['Note']}")
+            # Back off much longer if we hit rate limit despite throttling
+            return None, 20.0 * (attempt + 1)
+
+        return cast(Dict[str, Any], data), 0.0
 
-        with self._api_lock:
-            for attempt in range(max_retries):
-                # Ensure at least 12 seconds between calls (5 calls per minute)
-                now = time.time()
-                elapsed = now - AlphaVantageService._last_call_time
-                if elapsed < 12.0:
-                    wait_time = 12.0 - elapsed
-                    print(f"Alpha Vantage: Throttling request for {function} ({symbol}). Waiting {wait_time:.1f}s...")
-                    time.sleep(wait_time)
+    def _make_request(self, function: str, symbol: Optional[str] = None, max_retries: int = 3, **kwargs) -> Dict[str, Any]:
+        memo_key = self._memo_key(function, symbol, kwargs)
+        if (memoized := self._memo_get(memo_key)) is not None:
+            return memoized
 
-                try:
-                    response = requests.get(self.base_url, params=params, timeout=10)
-                    AlphaVantageService._last_call_time = time.time()
-                    response.raise_for_status()
-                    data = response.json()
-
-                    if "Error Message" in data:
-                        print(f"Alpha Vantage Error: {data['Error Message']}")
-                        return {}
-
-                    if "Note" in data:  # Rate limit hit
-                        print(f"Alpha Vantage Rate Limit: {data['Note']}")
-                        if attempt < max_retries - 1:
-                            # Sleep much longer if we hit rate limit despite throttling
-                            time.sleep(20 * (attempt + 1))
-                            continue
-                        return {}
-
-                    return cast(Dict[str, Any], data)
-                except Exception as e:
-                    print(f"Alpha Vantage Request Error (Attempt {attempt+1}): {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(5 * (attempt + 1))
-                        continue
-                    return {}
+        params = self._params(function, symbol, kwargs)
+        backoff = 0.0
+
+        for attempt in range(max_retries):
+            wait_time = self._reserve_slot(backoff) - time.monotonic()
+            if wait_time > 0:
+                print(f"Alpha Vantage: Throttling request for {function} ({symbol}). Waiting {wait_time:.1f}s...")
+                time.sleep(wait_time)
+
+            try:
+                response = self._session.get(self.base_url, params=params, timeout=10)
+                # Alpha Vantage signals errors and rate limits in 200 bodies; other statuses just retry
+                data = loads_json(response.content) if response.status_code == 200 else None
+            except Exception as e:
+                print(f"Alpha Vantage Request Error (Attempt {attempt+1}): {e}")
+                backoff = 5.0 * (attempt + 1)
+                continue
+            if data is None:
+                print(f"Alpha Vantage Request Error (Attempt {attempt+1}): HTTP {response.status_code}")
+                backoff = 5.0 * (attempt + 1)
+                continue
+
+            result, backoff = self._check_payload(data, attempt)
+            if result is not None:
+                self._memo_put(memo_key, result)
+                return result
         return {}
 
-    def get_prices(self, ticker: str, start_date: str, end_date: str) -> List[Price]:
-        """Fetch historical daily adjusted prices from Alpha Vantage."""
-        cache_key = f"{ticker}_{start_date}_{end_date}"
-        if cached_data := self.cache.get_prices(cache_key):
-            return [Price(**price) for price in cached_data]
+    async def _make_request_async(self, client: httpx.AsyncClient, function: str, symbol: Optional[str] = None, max_retries: int = 3, **kwargs) -> Dict[str, Any]:
+        """Async twin of _make_request sharing the same request schedule."""
+        memo_key = self._memo_key(function, symbol, kwargs)
+        if (memoized := self._memo_get(memo_key)) is not None:
+            return memoized
 
-        data = self._make_request("TIME_SERIES_DAILY_ADJUSTED", symbol=ticker, outputsize="full")
+        params = self._params(function, symbol, kwargs)
+        backoff = 0.0
 
-        time_series = data.get("Time Series (Daily)", {})
-        prices = []
+        for attempt in range(max_retries):
+            wait_time = self._reserve_slot(backoff) - time.monotonic()
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
 
-        for date_str, values in time_series.items():
-            # Filter by date range
-            if start_date <= date_str <= end_date:
-                try:
-                    prices.append(Price(time=date_str, open=float(values["1. open"]), high=float(values["2. high"]), low=float(values["3. low"]), close=float(values["4. close"]), volume=int(values["6. volume"])))
-                except (ValueError, KeyError) as e:
-                    print(f"Error parsing price for {date_str}: {e}")
-                    continue
+            try:
+                response = await client.get(self.base_url, params=params, timeout=10)
+                # Alpha Vantage signals errors and rate limits in 200 bodies; other statuses just retry
+                data = loads_json(response.content) if response.status_code == 200 else None
+            except Exception as e:
+                print(f"Alpha Vantage Request Error (Attempt {attempt+1}): {e}")
+                backoff = 5.0 * (attempt + 1)
+                continue
+            if data is None:
+                print(f"Alpha Vantage Request Error (Attempt {attempt+1}): HTTP {response.status_code}")
+                backoff = 5.0 * (attempt + 1)
+                continue
 
-        # Sort by date ascending
-        prices.sort(key=lambda x: x.time)
+            result, backoff = self._check_payload(data, attempt)
+            if result is not None:
+                self._memo_put(memo_key, result)
+                return result
+        return {}
+
+    def _parse_prices(self, ticker: str, start_date: str, end_date: str, data: Dict[str, Any]) -> List[Price]:
+        time_series = data.get("Time Series (Daily)", {})
+        prices: List[Price] = []
+
+        if time_series:
+            # One typed frame instead of per-day float()/int() calls; ISO dates compare and sort as strings
+            raw = pd.DataFrame.from_dict(time_series, orient="index").reindex(columns=list(_PRICE_COLUMNS))
+            raw = raw[(raw.index >= start_date) & (raw.index <= end_date)].sort_index()
+            try:
+                values = raw.astype(np.float64)
+            except (TypeError, ValueError):
+                # Malformed cells: convert one by one so only the affected days are dropped
+                values = raw.map(_to_float)
+
+            invalid = values.isna().any(axis=1).to_numpy()
+            for date_str in raw.index[invalid]:
+                print(f"Error parsing price for {date_str}: missing or non-numeric values")
+            values = values[~invalid]
+
+            columns = [values[column].tolist() for column in _PRICE_COLUMNS]
+            prices = [
+                Price(time=date_str, open=open_, high=high, low=low, close=close, volume=int(volume))
+                for date_str, open_, high, low, close, volume in zip(values.index, *columns)
+            ]
 
         if prices:
-            self.cache.set_prices(cache_key, [p.model_dump() for p in prices])
+            cache_key = f"{ticker}_{start_date}_{end_date}"
+            self.cache.set_prices(cache_key, prices_adapter.dump_python(prices))
+            self._result_put("prices", cache_key, prices)
 
         return prices
 
+    def get_prices(self, ticker: str, start_date: str, end_date: str) -> List[Price]:
+        """Fetch historical daily adjusted prices from Alpha Vantage."""
+        cache_key = f"{ticker}_{start_date}_{end_date}"
+        if (prices := self._result_get("prices", cache_key)) is not None:
+            return prices
+        if cached_data := self.cache.get_prices(cache_key):
+            prices = self._from_cache(Price, cached_data)
+            self._result_put("prices", cache_key, prices)
+            return prices
+
+        data = self._make_request("TIME_SERIES_DAILY_ADJUSTED", symbol=ticker, outputsize="full")
+        return self._parse_prices(ticker, start_date, end_date, data)
+
+    async def get_prices_bulk_async(self, tickers: List[str], start_date: str, end_date: str) -> Dict[str, List[Price]]:
+        """Fetch prices for many tickers concurrently; requests still start on the shared 12s schedule."""
+        async def fetch(client: httpx.AsyncClient, ticker: str) -> List[Price]:
+            cache_key = f"{ticker}_{start_date}_{end_date}"
+            if (prices := self._result_get("prices", cache_key)) is not None:
+                return prices
+            if cached_data := self.cache.get_prices(cache_key):
+                prices = self._from_cache(Price, cached_data)
+                self._result_put("prices", cache_key, prices)
+                return prices
+            data = await self._make_request_async(client, "TIME_SERIES_DAILY_ADJUSTED", symbol=ticker, outputsize="full")
+            return self._parse_prices(ticker, start_date, end_date, data)
+
+        async with httpx.AsyncClient() as client:
+            results = await asyncio.gather(*(fetch(client, ticker) for ticker in tickers))
+        return dict(zip(tickers, results))
+
+    def get_prices_bulk(self, tickers: List[str], start_date: str, end_date: str) -> Dict[str, List[Price]]:
+        """Sync wrapper around get_prices_bulk_async for callers outside an event loop."""
+        return asyncio.run(self.get_prices_bulk_async(tickers, start_date, end_date))
+
     def get_financial_metrics(self, ticker: str, end_date: str, period: str = "ttm", limit: int = 10) -> List[FinancialMetrics]:
         cache_key = f"{ticker}_{period}_{end_date}_{limit}"
+        if (metrics := self._result_get("financial_metrics", cache_key)) is not None:
+            return metrics
         if cached_data := self.cache.get_financial_metrics(cache_key):
-            return [FinancialMetrics(**metric) for metric in cached_data]
+            metrics = self._from_cache(FinancialMetrics, cached_data)
+            self._result_put("financial_metrics", cache_key, metrics)
+            return metrics
 
         # If limit is 1, OVERVIEW is enough and faster
         if limit == 1:
@@ -112,7 +339,8 @@ class AlphaVantageService(DataService):
                 return []
             try:
                 metric = self._map_overview_to_metric(ticker, end_date, period, data)
-                self.cache.set_financial_metrics(cache_key, [metric.model_dump()])
+                self.cache.set_financial_metrics(cache_key, metrics_adapter.dump_python([metric]))
+                self._result_put("financial_metrics", cache_key, [metric])
                 return [metric]
             except Exception as e:
                 print(f"Error mapping AV overview: {e}")
@@ -125,6 +353,7 @@ class AlphaVantageService(DataService):
             return self.get_financial_metrics(ticker, end_date, period, 1)
 
         metrics = []
+        growth_bases = []  # per metric, the values behind _GROWTH_FIELDS in the same order
         for li in line_items:
             try:
                 # Map values safely with defaults
@@ -188,19 +417,25 @@ class AlphaVantageService(DataService):
                     book_value_per_share=equity / shares if shares else 0.0,
                 )
                 metrics.append(metric)
+                growth_bases.append((metric.earnings_per_share, rev, ni, fcf, ebit, li.ebitda or 0.0, equity))
             except Exception as e:
                 print(f"Error creating FinancialMetric from LineItem: {e}")
                 continue
 
-        # Add historical growth calculations if we have multiple periods
-        for i in range(len(metrics) - 1):
-            curr = metrics[i]
-            prev = metrics[i + 1]
-            if prev.earnings_per_share and prev.earnings_per_share > 0:
-                curr.earnings_per_share_growth = (curr.earnings_per_share / prev.earnings_per_share) - 1
+        # Period-over-period growth (newest first) for every _GROWTH_FIELDS entry in one NumPy pass;
+        # a missing or non-positive prior value leaves the field at 0
+        if len(metrics) > 1:
+            values = np.array(growth_bases, dtype=np.float64)
+            curr, prev = values[:-1], values[1:]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                growth = np.where(prev > 0, curr / prev - 1, 0.0)
+            for metric, row in zip(metrics, growth.tolist()):
+                for field, value in zip(_GROWTH_FIELDS, row):
+                    setattr(metric, field, value)
 
         if metrics:
-            self.cache.set_financial_metrics(cache_key, [m.model_dump() for m in metrics])
+            self.cache.set_financial_metrics(cache_key, metrics_adapter.dump_python(metrics))
+            self._result_put("financial_metrics", cache_key, metrics)
 
         return metrics
 
@@ -254,14 +489,17 @@ class AlphaVantageService(DataService):
     def search_line_items(self, ticker: str, line_items: List[str], end_date: str, period: str = "ttm", limit: int = 10) -> List[LineItem]:
         cache_key = f"line_{ticker}_{period}_{end_date}_{limit}"
         if cached_data := self.cache.get_line_items(cache_key):
-            return [LineItem(**item) for item in cached_data]
+            return self._from_cache(LineItem, cached_data)
 
-        income = self._make_request("INCOME_STATEMENT", symbol=ticker)
-        balance = self._make_request("BALANCE_SHEET", symbol=ticker)
-        cash = self._make_request("CASH_FLOW", symbol=ticker)
+        income_f, balance_f, cash_f = (_STATEMENT_POOL.submit(self._make_request, function, symbol=ticker) for function in ("INCOME_STATEMENT", "BALANCE_SHEET", "CASH_FLOW"))
+        income, balance, cash = income_f.result(), balance_f.result(), cash_f.result()
 
         report_key = "annualReports" if period == "annual" else "quarterlyReports"
 
+        # Index BS and CF reports by date once (reversed so the first report for a date wins)
+        bs_by_date = {x.get("fiscalDateEnding"): x for x in reversed(balance.get(report_key, []))} if balance else {}
+        cf_by_date = {x.get("fiscalDateEnding"): x for x in reversed(cash.get(report_key, []))} if cash else {}
+
         reports = []
         if income and report_key in income:
             inc_reports = income[report_key][:limit]
@@ -269,33 +507,24 @@ class AlphaVantageService(DataService):
                 date = inc.get("fiscalDateEnding")
 
                 # Find matching BS and CF
-                bs = next((x for x in balance.get(report_key, []) if x.get("fiscalDateEnding") == date), {}) if balance else {}
-                cf = next((x for x in cash.get(report_key, []) if x.get("fiscalDateEnding") == date), {}) if cash else {}
+                bs = bs_by_date.get(date, {})
+                cf = cf_by_date.get(date, {})
 
                 # Construct LineItem
                 try:
-                    item = LineItem(
+                    fields = {dst: _report_float(inc.get(src)) for dst, src in _INC_FIELDS}
+                    fields.update({dst: _report_float(bs.get(src)) for dst, src in _BS_FIELDS})
+                    capex = _report_float(cf.get("capitalExpenditures"))
+                    fields["depreciation_and_amortization"] = fields["depreciation_and_amortization"] or _report_float(cf.get("depreciation"))
+                    # Every value is already a str/float built above, so validation is skipped
+                    item = LineItem.model_construct(
                         ticker=ticker,
                         report_period=str(date),
                         period=period,
                         currency=str(inc.get("reportedCurrency", "USD")),
-                        revenue=float(inc.get("totalRevenue", 0) or 0),
-                        net_income=float(inc.get("netIncome", 0) or 0),
-                        depreciation_and_amortization=float(inc.get("depreciationAndAmortization", 0) or 0) or float(cf.get("depreciation", 0) or 0),
-                        capital_expenditure=float(cf.get("capitalExpenditures", 0) or 0),
-                        research_and_development=float(inc.get("researchAndDevelopment", 0) or 0),
-                        total_assets=float(bs.get("totalAssets", 0) or 0),
-                        total_liabilities=float(bs.get("totalLiabilities", 0) or 0),
-                        total_current_assets=float(bs.get("totalCurrentAssets", 0) or 0),
-                        total_current_liabilities=float(bs.get("totalCurrentLiabilities", 0) or 0),
-                        shareholders_equity=float(bs.get("totalShareholderEquity", 0) or 0),
-                        long_term_debt=float(bs.get("longTermDebt", 0) or 0),
-                        short_term_debt=float(bs.get("shortTermDebt", 0) or 0),
-                        interest_expense=float(inc.get("interestExpense", 0) or 0),
-                        ebitda=float(inc.get("ebitda", 0) or 0),
-                        ebit=float(inc.get("ebit", 0) or 0),
-                        outstanding_shares=float(bs.get("commonStockSharesOutstanding", 0) or 0),
-                        free_cash_flow=float(cf.get("operatingCashflow", 0) or 0) - float(cf.get("capitalExpenditures", 0) or 0),
+                        capital_expenditure=capex,
+                        free_cash_flow=_report_float(cf.get("operatingCashflow")) - capex,
+                        **fields,
                     )
                     reports.append(item)
                 except Exception as e:
@@ -303,7 +532,7 @@ class AlphaVantageService(DataService):
                     continue
 
         if reports:
-            self.cache.set_line_items(cache_key, [r.model_dump() for r in reports])
+            self.cache.set_line_items(cache_key, line_items_adapter.dump_python(reports))
 
         return reports
 
@@ -313,15 +542,14 @@ class AlphaVantageService(DataService):
     def get_company_news(self, ticker: str, end_date: str, start_date: Optional[str] = None, limit: int = 1000) -> List[CompanyNews]:
         cache_key = f"news_{ticker}_{start_date}_{end_date}_{limit}"
         if cached_data := self.cache.get_company_news(cache_key):
-            return [CompanyNews(**news) for news in cached_data]
+            return self._from_cache(CompanyNews, cached_data)
 
         data = self._make_request("NEWS_SENTIMENT", tickers=ticker, limit=limit)
         news_list = []
         if "feed" in data:
             for item in data["feed"]:
                 try:
-                    date_str = item.get("time_published", "")
-                    dt = datetime.strptime(date_str, "%Y%m%dT%H%M%S")
+                    dt = _parse_published(item.get("time_published", ""))
 
                     news = CompanyNews(
                         ticker=ticker, 
@@ -339,13 +567,16 @@ class AlphaVantageService(DataService):
                     continue
 
         if news_list:
-            self.cache.set_company_news(cache_key, [n.model_dump() for n in news_list])
+            self.cache.set_company_news(cache_key, news_adapter.dump_python(news_list))
 
         return news_list
 
     def get_market_cap(self, ticker: str, end_date: str) -> Optional[float]:
         """Get market capitalization, checking cache first."""
         cache_key = f"{ticker}_ttm_{end_date}_1"
+        # Shares the limit=1 get_financial_metrics entry
+        if metrics := self._result_get("financial_metrics", cache_key):
+            return metrics[0].market_cap
         if cached_data := self.cache.get_financial_metrics(cache_key):
             if isinstance(cached_data[0], dict):
                 return cast(float, cached_data[0].get("market_cap"))
@@ -357,7 +588,8 @@ class AlphaVantageService(DataService):
 
         try:
             metric = self._map_overview_to_metric(ticker, end_date, "ttm", data)
-            self.cache.set_financial_metrics(cache_key, [metric.model_dump()])
+            self.cache.set_financial_metrics(cache_key, metrics_adapter.dump_python([metric]))
+            self._result_put("financial_metrics", cache_key, [metric])
         except:
             pass
 
@@ -1,12 +1,17 @@
+import asyncio
+import json
 import os
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional, Any, Dict
+from typing import Callable, List, Optional, Any, Dict, Type, TypeVar
 
+import httpx
 import pandas as pd
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from pydantic import TypeAdapter
 
 # Load environment variables from root .env
 load_dotenv("../.env")
@@ -26,10 +31,54 @@ from data.models import (
     PriceResponse,
 )
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+# Compiled list (de)serializers for the cache: one call per list instead of per-item model_dump / Model(**d)
+prices_adapter = TypeAdapter(List[Price])
+metrics_adapter = TypeAdapter(List[FinancialMetrics])
+line_items_adapter = TypeAdapter(List[LineItem])
+news_adapter = TypeAdapter(List[CompanyNews])
+insider_trades_adapter = TypeAdapter(List[InsiderTrade])
+_LIST_ADAPTERS: Dict[type, TypeAdapter] = {
+    Price: prices_adapter,
+    FinancialMetrics: metrics_adapter,
+    LineItem: line_items_adapter,
+    CompanyNews: news_adapter,
+    InsiderTrade: insider_trades_adapter,
+}
+
+ModelT = TypeVar("ModelT")
+
+
+def loads_json(content: bytes) -> Any:
+    """Decode a response body; payloads run to megabytes and orjson parses the raw bytes without a str copy."""
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+def pooled_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """Session with a keep-alive connection pool; retries stay in the callers' own loops."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0))
+    if headers:
+        session.headers.update(headers)
+    return session
+
 
 class DataService(ABC):
     """Abstract base class for financial data services."""
 
+    # Cache rows are only ever written from already-validated models, so hits are rebuilt with
+    # model_construct (no validation). Set False for a cache backend other code can write to.
+    trust_cache: bool = True
+
+    def _from_cache(self, model: Type[ModelT], cached_data: List[Dict[str, Any]]) -> List[ModelT]:
+        if self.trust_cache:
+            return [model.model_construct(**row) for row in cached_data]  # type: ignore[attr-defined]
+        return _LIST_ADAPTERS[model].validate_python(cached_data)
+
     @abstractmethod
     def get_prices(self, ticker: str, start_date: str, end_date: str) -> List[Price]:
         pass
@@ -59,13 +108,18 @@ class DataService(ABC):
         if not prices:
             return pd.DataFrame()
 
-        df = pd.DataFrame([p.model_dump() for p in prices])
-        df["Date"] = pd.to_datetime(df["time"])
-        df.set_index("Date", inplace=True)
-        numeric_cols = ["open", "close", "high", "low", "volume"]
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
+        # Price fields are already typed floats/ints, so columns are read straight off the models
+        df = pd.DataFrame(
+            {
+                "open": [p.open for p in prices],
+                "close": [p.close for p in prices],
+                "high": [p.high for p in prices],
+                "low": [p.low for p in prices],
+                "volume": [p.volume for p in prices],
+                "time": [p.time for p in prices],
+            }
+        )
+        df.index = pd.DatetimeIndex(pd.to_datetime(df["time"], format="ISO8601"), name="Date")
         df.sort_index(inplace=True)
         return df
 
@@ -77,18 +131,19 @@ class FinancialDatasetsService(DataService):
         self.api_key = api_key or os.environ.get("FINANCIAL_DATASETS_API_KEY")
         self.cache = get_cache()
         self.base_url = "https://api.financialdatasets.ai"
+        self._session = pooled_session({"X-API-KEY": self.api_key} if self.api_key else None)
 
-    def _make_api_request(self, url: str, method: str = "GET", json_data: Optional[Dict[str, Any]] = None, max_retries: int = 3) -> requests.Response:
-        headers = {}
-        if self.api_key:
-            headers["X-API-KEY"] = self.api_key
+    def close(self) -> None:
+        """Release the pooled connections."""
+        self._session.close()
 
+    def _make_api_request(self, url: str, method: str = "GET", json_data: Optional[Dict[str, Any]] = None, max_retries: int = 3) -> requests.Response:
         response = requests.Response()  # Initialize to avoid unbound errors
         for attempt in range(max_retries + 1):
             if method.upper() == "POST":
-                response = requests.post(url, headers=headers, json=json_data)
+                response = self._session.post(url, json=json_data)
             else:
-                response = requests.get(url, headers=headers)
+                response = self._session.get(url)
 
             if response.status_code == 429 and attempt < max_retries:
                 delay = 60 + (30 * attempt)
@@ -102,7 +157,7 @@ class FinancialDatasetsService(DataService):
     def get_prices(self, ticker: str, start_date: str, end_date: str) -> List[Price]:
         cache_key = f"{ticker}_{start_date}_{end_date}"
         if cached_data := self.cache.get_prices(cache_key):
-            return [Price(**price) for price in cached_data]
+            return self._from_cache(Price, cached_data)
 
         url = f"{self.base_url}/prices/?ticker={ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
         response = self._make_api_request(url)
@@ -111,10 +166,10 @@ class FinancialDatasetsService(DataService):
             return []
 
         try:
-            price_response = PriceResponse(**response.json())
+            price_response = PriceResponse.model_validate_json(response.content)
             prices = price_response.prices
             if prices:
-                self.cache.set_prices(cache_key, [p.model_dump() for p in prices])
+                self.cache.set_prices(cache_key, prices_adapter.dump_python(prices))
             return prices
         except Exception as e:
             print(f"Error parsing prices: {e}")
@@ -123,7 +178,7 @@ class FinancialDatasetsService(DataService):
     def get_financial_metrics(self, ticker: str, end_date: str, period: str = "ttm", limit: int = 10) -> List[FinancialMetrics]:
         cache_key = f"{ticker}_{period}_{end_date}_{limit}"
         if cached_data := self.cache.get_financial_metrics(cache_key):
-            return [FinancialMetrics(**metric) for metric in cached_data]
+            return self._from_cache(FinancialMetrics, cached_data)
 
         url = f"{self.base_url}/financial-metrics/?ticker={ticker}&report_period_lte={end_date}&limit={limit}&period={period}"
         response = self._make_api_request(url)
@@ -132,10 +187,10 @@ class FinancialDatasetsService(DataService):
             return []
 
         try:
-            metrics_response = FinancialMetricsResponse(**response.json())
+            metrics_response = FinancialMetricsResponse.model_validate_json(response.content)
             metrics = metrics_response.financial_metrics
             if metrics:
-                self.cache.set_financial_metrics(cache_key, [m.model_dump() for m in metrics])
+                self.cache.set_financial_metrics(cache_key, metrics_adapter.dump_python(metrics))
             return metrics
         except Exception:
             return []
@@ -156,31 +211,39 @@ class FinancialDatasetsService(DataService):
             return []
 
         try:
-            response_model = LineItemResponse(**response.json())
+            response_model = LineItemResponse.model_validate_json(response.content)
             return response_model.search_results[:limit]
         except Exception:
             return []
 
+    def _insider_trades_url(self, ticker: str, end_date: str, start_date: Optional[str], limit: int) -> str:
+        url = f"{self.base_url}/insider-trades/?ticker={ticker}&filing_date_lte={end_date}"
+        if start_date:
+            url += f"&filing_date_gte={start_date}"
+        return url + f"&limit={limit}"
+
+    def _news_url(self, ticker: str, end_date: str, start_date: Optional[str], limit: int) -> str:
+        url = f"{self.base_url}/news/?ticker={ticker}&end_date={end_date}"
+        if start_date:
+            url += f"&start_date={start_date}"
+        return url + f"&limit={limit}"
+
     def get_insider_trades(self, ticker: str, end_date: str, start_date: Optional[str] = None, limit: int = 1000) -> List[InsiderTrade]:
         cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
         if cached_data := self.cache.get_insider_trades(cache_key):
-            return [InsiderTrade(**trade) for trade in cached_data]
+            return self._from_cache(InsiderTrade, cached_data)
 
         all_trades = []
         current_end_date = end_date
 
         while True:
-            url = f"{self.base_url}/insider-trades/?ticker={ticker}&filing_date_lte={current_end_date}"
-            if start_date:
-                url += f"&filing_date_gte={start_date}"
-            url += f"&limit={limit}"
-
+            url = self._insider_trades_url(ticker, current_end_date, start_date, limit)
             response = self._make_api_request(url)
             if response.status_code != 200:
                 break
 
             try:
-                response_model = InsiderTradeResponse(**response.json())
+                response_model = InsiderTradeResponse.model_validate_json(response.content)
                 trades = response_model.insider_trades
             except Exception:
                 break
@@ -198,30 +261,26 @@ class FinancialDatasetsService(DataService):
                 break
 
         if all_trades:
-            self.cache.set_insider_trades(cache_key, [t.model_dump() for t in all_trades])
+            self.cache.set_insider_trades(cache_key, insider_trades_adapter.dump_python(all_trades))
 
         return all_trades
 
     def get_company_news(self, ticker: str, end_date: str, start_date: Optional[str] = None, limit: int = 1000) -> List[CompanyNews]:
         cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
         if cached_data := self.cache.get_company_news(cache_key):
-            return [CompanyNews(**news) for news in cached_data]
+            return self._from_cache(CompanyNews, cached_data)
 
         all_news = []
         current_end_date = end_date
 
         while True:
-            url = f"{self.base_url}/news/?ticker={ticker}&end_date={current_end_date}"
-            if start_date:
-                url += f"&start_date={start_date}"
-            url += f"&limit={limit}"
-
+            url = self._news_url(ticker, current_end_date, start_date, limit)
             response = self._make_api_request(url)
             if response.status_code != 200:
                 break
 
             try:
-                response_model = CompanyNewsResponse(**response.json())
+                response_model = CompanyNewsResponse.model_validate_json(response.content)
                 news_items = response_model.news
             except Exception:
                 break
@@ -239,10 +298,116 @@ class FinancialDatasetsService(DataService):
                 break
 
         if all_news:
-            self.cache.set_company_news(cache_key, [n.model_dump() for n in all_news])
+            self.cache.set_company_news(cache_key, news_adapter.dump_python(all_news))
 
         return all_news
 
+    async def _make_api_request_async(self, client: httpx.AsyncClient, url: str, max_retries: int = 3) -> httpx.Response:
+        """Async twin of _make_api_request (GET only) with the same 429 back-off."""
+        response = await client.get(url)
+        for attempt in range(max_retries):
+            if response.status_code != 429:
+                break
+            delay = 60 + (30 * attempt)
+            print(f"Rate limited (429). Attempt {attempt + 1}/{max_retries + 1}. Waiting {delay}s before retrying...")
+            await asyncio.sleep(delay)
+            response = await client.get(url)
+        return response
+
+    async def _paginate_async(
+        self,
+        client: httpx.AsyncClient,
+        url_for: Callable[[str], str],
+        parse: Callable[[bytes], List[Any]],
+        page_date: Callable[[Any], str],
+        end_date: str,
+        start_date: Optional[str],
+        limit: int,
+    ) -> List[Any]:
+        # Same cursor walk as the sync loops: each page ends where the previous one's oldest item was
+        items: List[Any] = []
+        current_end_date = end_date
+        while True:
+            response = await self._make_api_request_async(client, url_for(current_end_date))
+            if response.status_code != 200:
+                break
+            try:
+                page = parse(response.content)
+            except Exception:
+                break
+            if not page:
+                break
+
+            items.extend(page)
+            if not start_date or len(page) < limit:
+                break
+
+            current_end_date = min(page_date(item) for item in page).split("T")[0]
+            if current_end_date <= start_date:
+                break
+        return items
+
+    def _async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            headers={"X-API-KEY": self.api_key} if self.api_key else None,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0,
+        )
+
+    async def get_insider_trades_bulk_async(self, tickers: List[str], end_date: str, start_date: Optional[str] = None, limit: int = 1000) -> Dict[str, List[InsiderTrade]]:
+        """Insider trades for many tickers; tickers are fetched concurrently, pages within a ticker in order."""
+        async def fetch(client: httpx.AsyncClient, ticker: str) -> List[InsiderTrade]:
+            cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
+            if cached_data := self.cache.get_insider_trades(cache_key):
+                return self._from_cache(InsiderTrade, cached_data)
+            trades = await self._paginate_async(
+                client,
+                lambda current: self._insider_trades_url(ticker, current, start_date, limit),
+                lambda content: InsiderTradeResponse.model_validate_json(content).insider_trades,
+                lambda trade: trade.filing_date,
+                end_date,
+                start_date,
+                limit,
+            )
+            if trades:
+                self.cache.set_insider_trades(cache_key, insider_trades_adapter.dump_python(trades))
+            return trades
+
+        async with self._async_client() as client:
+            results = await asyncio.gather(*(fetch(client, ticker) for ticker in tickers))
+        return dict(zip(tickers, results))
+
+    async def get_company_news_bulk_async(self, tickers: List[str], end_date: str, start_date: Optional[str] = None, limit: int = 1000) -> Dict[str, List[CompanyNews]]:
+        """Company news for many tickers; tickers are fetched concurrently, pages within a ticker in order."""
+        async def fetch(client: httpx.AsyncClient, ticker: str) -> List[CompanyNews]:
+            cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
+            if cached_data := self.cache.get_company_news(cache_key):
+                return self._from_cache(CompanyNews, cached_data)
+            news = await self._paginate_async(
+                client,
+                lambda current: self._news_url(ticker, current, start_date, limit),
+                lambda content: CompanyNewsResponse.model_validate_json(content).news,
+                lambda item: item.date,
+                end_date,
+                start_date,
+                limit,
+            )
+            if news:
+                self.cache.set_company_news(cache_key, news_adapter.dump_python(news))
+            return news
+
+        async with self._async_client() as client:
+            results = await asyncio.gather(*(fetch(client, ticker) for ticker in tickers))
+        return dict(zip(tickers, results))
+
+    def get_insider_trades_bulk(self, tickers: List[str], end_date: str, start_date: Optional[str] = None, limit: int = 1000) -> Dict[str, List[InsiderTrade]]:
+        """Sync wrapper around get_insider_trades_bulk_async for callers outside an event loop."""
+        return asyncio.run(self.get_insider_trades_bulk_async(tickers, end_date, start_date, limit))
+
+    def get_company_news_bulk(self, tickers: List[str], end_date: str, start_date: Optional[str] = None, limit: int = 1000) -> Dict[str, List[CompanyNews]]:
+        """Sync wrapper around get_company_news_bulk_async for callers outside an event loop."""
+        return asyncio.run(self.get_company_news_bulk_async(tickers, end_date, start_date, limit))
+
     def get_market_cap(self, ticker: str, end_date: str) -> Optional[float]:
         # If end_date is today, use company facts
         if end_date == datetime.now().strftime("%Y-%m-%d"):
@@ -250,7 +415,7 @@ class FinancialDatasetsService(DataService):
             response = self._make_api_request(url)
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = loads_json(response.content)
                     return CompanyFactsResponse(**data).company_facts.market_cap
                 except:
                     pass
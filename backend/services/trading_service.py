@@ -1,8 +1,11 @@
 import os
 from datetime import datetime
+from decimal import Decimal
 from typing import Dict, List, Optional
 
 from dotenv import load_dotenv
+from pydantic import TypeAdapter
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 # Load environment variables from root .env
@@ -10,7 +13,10 @@ load_dotenv("../.env")
 
 from database.models import Trade
 from services.trading.alpaca import AlpacaLiveProvider, AlpacaPaperProvider
-from services.trading.base import OrderSide, OrderStatus, OrderType, TradingProvider
+from services.trading.base import OrderSide, OrderStatus, OrderType, Position, TradingProvider
+
+# Compiled once; serializes a whole position list in one call
+_positions_adapter = TypeAdapter(List[Position])
 
 
 class TradingService:
@@ -42,13 +48,17 @@ class TradingService:
         if not self.provider:
             return []
         positions = self.provider.get_positions()
-        return [p.model_dump() for p in positions]
+        return _positions_adapter.dump_python(positions, mode="python")
+
+    @staticmethod
+    def _trade_row(ticker: str, action: str, quantity: int, rationale: Dict, flow_run_id: Optional[int] = None, risk_score: Optional[float] = None, limit_price: Optional[float] = None) -> Dict:
+        return {"ticker": ticker, "action": action.upper(), "quantity": quantity, "order_type": "limit" if limit_price else "market", "limit_price": Decimal(str(limit_price)) if limit_price else None, "persona_rationale": rationale, "risk_score": Decimal(str(risk_score)) if risk_score is not None else None, "flow_run_id": flow_run_id, "status": "PENDING_APPROVAL"}
 
     def create_trade_request(self, ticker: str, action: str, quantity: int, rationale: Dict, flow_run_id: Optional[int] = None, risk_score: Optional[float] = None, limit_price: Optional[float] = None) -> Trade:
         """
         Creates a trade request in the database.
         """
-        trade = Trade(ticker=ticker, action=action.upper(), quantity=quantity, order_type="limit" if limit_price else "market", limit_price=str(limit_price) if limit_price else None, persona_rationale=rationale, risk_score=str(risk_score) if risk_score is not None else None, flow_run_id=flow_run_id, status="PENDING_APPROVAL")
+        trade = Trade(**self._trade_row(ticker, action, quantity, rationale, flow_run_id, risk_score, limit_price))
         self.db.add(trade)
         self.db.commit()
         self.db.refresh(trade)
@@ -58,6 +68,24 @@ class TradingService:
 
         return trade
 
+    def create_trade_requests_bulk(self, requests: List[Dict]) -> List[int]:
+        """
+        Creates many trade requests with a single batched INSERT. Each request takes the
+        create_trade_request keyword arguments. Returns the new trade IDs in input order.
+        """
+        if not requests:
+            return []
+
+        rows = [self._trade_row(**request) for request in requests]
+        trade_ids = list(self.db.scalars(insert(Trade).returning(Trade.id, sort_by_parameter_order=True), rows))
+        self.db.commit()
+
+        if self.mode == "paper":
+            for trade_id in trade_ids:
+                self.execute_trade(trade_id)
+
+        return trade_ids
+
     def execute_trade(self, trade_id: int, approver: str = "SYSTEM") -> Trade:
         trade = self.db.query(Trade).filter(Trade.id == trade_id).first()
         if not trade:
@@ -89,7 +117,7 @@ class TradingService:
 
             if order.status == OrderStatus.FILLED:
                 trade.status = "EXECUTED"
-                trade.execution_price = str(order.filled_avg_price)
+                trade.execution_price = Decimal(str(order.filled_avg_price)) if order.filled_avg_price is not None else None
 
         except Exception as e:
             trade.status = "FAILED"
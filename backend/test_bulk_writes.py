@@ -0,0 +1,142 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database.connection import Base
+from database.models import CyclePerformanceSummary, HedgeFundFlow, HedgeFundFlowRun, HedgeFundFlowRunCycle, ProposedTrade, Trade
+from repositories.flow_repository import FlowRepository
+from repositories.flow_run_cycle_repository import FlowRunCycleRepository
+from services.brokerage import BrokerageService
+from services.trading_service import TradingService
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    flow = HedgeFundFlow(name="bulk", nodes=[], edges=[])
+    session.add(flow)
+    session.flush()
+    session.add(HedgeFundFlowRun(id=1, flow_id=flow.id))
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_create_cycles_bulk_round_trip(db):
+    repo = FlowRunCycleRepository(db)
+    ids = repo.create_cycles_bulk(1, [
+        {"cycle_number": 1, "estimated_cost": Decimal("0.1250")},
+        {"cycle_number": 2, "trigger_reason": "scheduled"},
+    ])
+
+    assert len(ids) == 2
+    cycles = {c.id: c for c in db.query(HedgeFundFlowRunCycle).all()}
+    assert set(cycles) == set(ids)
+    first, second = cycles[ids[0]], cycles[ids[1]]
+    assert (first.cycle_number, first.flow_run_id, first.status) == (1, 1, "IN_PROGRESS")
+    assert first.estimated_cost == Decimal("0.1250")
+    assert second.trigger_reason == "scheduled" and second.estimated_cost is None
+    assert repo.create_cycles_bulk(1, []) == []
+
+
+
+def test_complete_cycle_upserts_summary(db):
+    repo = FlowRunCycleRepository(db)
+    cycle = repo.create_cycle(1, 1, trigger_reason="scheduled")
+
+    repo.complete_cycle(
+        cycle.id,
+        portfolio_snapshot={"cash": 900.0, "portfolio_value": 1500.0, "positions": {"AAPL": {"long": 3}}},
+        performance_metrics={"pnl": 12.5, "sharpe_ratio": 1.2, "gross_exposure": 0.6, "net_exposure": 0.4},
+    )
+    (summary,) = repo.get_cycle_summaries(1)
+    assert (summary.cycle_id, summary.cycle_number) == (cycle.id, 1)
+    assert (summary.pnl, summary.sharpe, summary.cash, summary.equity, summary.positions_count) == (12.5, 1.2, 900.0, 1500.0, 1)
+    assert summary.completed_at is not None
+
+    # Completing again updates the same row instead of inserting a second one
+    repo.complete_cycle(cycle.id, performance_metrics={"pnl": -3.0, "sharpe_ratio": 0.1})
+    db.expire_all()
+    (summary,) = repo.get_cycle_summaries(1)
+    assert (summary.pnl, summary.sharpe, summary.gross_exposure, summary.cash) == (-3.0, 0.1, None, 900.0)
+
+
+def test_rebuild_summary_backfills_completed_cycles(db):
+    repo = FlowRunCycleRepository(db)
+    first, second, open_cycle = (repo.create_cycle(1, n) for n in (1, 2, 3))
+    repo.complete_cycle(first.id, performance_metrics={"pnl": 1.0})
+    repo.complete_cycle(second.id, performance_metrics={"pnl": 2.0})
+    db.query(CyclePerformanceSummary).delete()
+    db.commit()
+
+    assert repo.rebuild_summary(1) == 2
+    summaries = repo.get_cycle_summaries(1)
+    assert [(s.cycle_id, s.cycle_number, s.pnl) for s in summaries] == [(first.id, 1, 1.0), (second.id, 2, 2.0)]
+    assert open_cycle.id not in {s.cycle_id for s in summaries}
+
+
+def test_create_trade_requests_bulk_round_trip(db, monkeypatch):
+    # Live mode skips the paper auto-execution, so no provider is needed
+    monkeypatch.setenv("TRADING_MODE", "live")
+    monkeypatch.delenv("ALPACA_API_KEY", raising=False)
+    monkeypatch.delenv("ALPACA_SECRET_KEY", raising=False)
+    service = TradingService(db)
+
+    ids = service.create_trade_requests_bulk([
+        {"ticker": "AAPL", "action": "buy", "quantity": 10, "rationale": {"why": "momentum"}, "flow_run_id": 1, "risk_score": 0.35, "limit_price": 187.25},
+        {"ticker": "NVDA", "action": "sell", "quantity": 5, "rationale": {}},
+    ])
+
+    assert len(ids) == 2
+    trades = {t.id: t for t in db.query(Trade).all()}
+    assert set(trades) == set(ids)
+    aapl, nvda = trades[ids[0]], trades[ids[1]]
+    assert (aapl.action, aapl.order_type, aapl.status) == ("BUY", "limit", "PENDING_APPROVAL")
+    assert aapl.limit_price == Decimal("187.25") and aapl.risk_score == Decimal("0.35")
+    assert aapl.persona_rationale == {"why": "momentum"}
+    assert (nvda.order_type, nvda.limit_price, nvda.risk_score, nvda.flow_run_id) == ("market", None, None, None)
+    assert service.create_trade_requests_bulk([]) == []
+
+
+def test_get_flows_by_name_ranks_exact_match_first(db):
+    for name in ["My momentum", "Momentum v2", "Momentum", "mean_rev", "meanXrev"]:
+        db.add(HedgeFundFlow(name=name, nodes=[], edges=[]))
+    db.commit()
+    repo = FlowRepository(db)
+
+    names = [f.name for f in repo.get_flows_by_name("momentum")]
+    assert names[0] == "Momentum"
+    assert sorted(names) == ["Momentum", "Momentum v2", "My momentum"]
+    # "_" is matched literally, not as a LIKE wildcard
+    assert [f.name for f in repo.get_flows_by_name("mean_rev")] == ["mean_rev"]
+
+
+def test_propose_trades_bulk_round_trip(db, monkeypatch):
+    monkeypatch.delenv("ALPACA_API_KEY", raising=False)
+    monkeypatch.delenv("ALPACA_SECRET_KEY", raising=False)
+    service = BrokerageService(db)
+
+    trades = service.propose_trades_bulk([
+        {"ticker": "AAPL", "action": "buy", "quantity": 10, "flow_run_id": 1},
+        {"ticker": "NVDA", "action": "Sell", "quantity": 5, "persona_logic": {"why": "overbought"}},
+        {"ticker": "MSFT", "action": "BUY", "quantity": 1},
+    ])
+
+    assert [t["ticker"] for t in trades] == ["AAPL", "NVDA", "MSFT"]
+    assert [t["action"] for t in trades] == ["BUY", "SELL", "BUY"]
+    assert {t["status"] for t in trades} == {"PENDING"}
+    assert len({t["approval_token"] for t in trades}) == 3
+    assert trades[0]["flow_run_id"] == 1 and trades[1]["flow_run_id"] is None
+
+    stored = {t.id: t for t in db.query(ProposedTrade).all()}
+    assert [stored[t["id"]].ticker for t in trades] == ["AAPL", "NVDA", "MSFT"]
+    assert stored[trades[1]["id"]].persona_logic == {"why": "overbought"}
+    assert service.propose_trades_bulk([]) == []
@@ -9,6 +9,8 @@ from lean_bridge.context import AlgorithmContext
 from core.portfolio_manager import MeanVarianceOptimizationPortfolioConstructionModel
 from core.execution_planner import ExecutionPlanner
 from graph.risk_management import InstitutionalRiskModel
+from lean_bridge.contracts import AlphaModel
+from lean_bridge.pipeline import run_lean_pipeline
 
 async def test_lean_pipeline():
     print("🚀 Starting LEAN-Faithful Pipeline Integration Test")
@@ -71,5 +73,56 @@ async def test_lean_pipeline():
 
     print("\n✅ LEAN-Faithful Pipeline Test Passed!")
 
+class _SyncAlpha(AlphaModel):
+    name = "SyncAlpha"
+
+    def update(self, state, data):
+        return [Insight.price("AAPL", timedelta(days=1), InsightDirection.UP, 0.05, 0.8, self.name)]
+
+
+class _AsyncAlpha(AlphaModel):
+    name = "AsyncAlpha"
+
+    async def update(self, state, data):
+        await asyncio.sleep(0)
+        return [Insight.price("NVDA", timedelta(days=1), InsightDirection.DOWN, -0.02, 0.7, self.name)]
+
+
+async def test_run_lean_pipeline_mixed_alpha_models():
+    context = AlgorithmContext(
+        time=datetime.now(UTC),
+        universe=["AAPL", "NVDA"],
+        portfolio_state={"equity": 100000.0, "positions": {}},
+        config={"current_prices": {"AAPL": 150.0, "NVDA": 500.0}},
+    )
+
+    await run_lean_pipeline(
+        context,
+        [_SyncAlpha(), _AsyncAlpha()],
+        MeanVarianceOptimizationPortfolioConstructionModel(target_return=0.01),
+        InstitutionalRiskModel(),
+        ExecutionPlanner(),
+        data={},
+    )
+
+    assert {i.source_model for i in context.active_insights} == {"SyncAlpha", "AsyncAlpha"}
+
+
+def test_active_insights_tracks_direct_edits():
+    now = datetime.now(UTC)
+    context = AlgorithmContext(time=now, universe=["AAPL"], portfolio_state={}, config={})
+    context.add_insights([Insight.price("AAPL", timedelta(days=1), InsightDirection.UP, 0.05, 0.8, "M1")])
+
+    # Callers get a copy, not the context's own list
+    context.active_insights.clear()
+    assert len(context.active_insights) == 1
+
+    stale = Insight(symbol="NVDA", generated_time_utc=now - timedelta(days=2), period=timedelta(days=1), direction=InsightDirection.DOWN, magnitude=-0.02, source_model="M2")
+    context.insights.append(stale)
+    assert [i.symbol for i in context.active_insights] == ["AAPL"]
+
+    context.insights = [stale]
+    assert context.active_insights == []
+
 if __name__ == "__main__":
     asyncio.run(test_lean_pipeline())
\ No newline at end of file
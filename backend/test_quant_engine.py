@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+import asyncio
+
+import pandas as pd
+
+import tools.api
+from core.quant_engine import QuantEngine
+
+
+def test_prices_wide_aligns_alpaca_and_alpha_vantage(monkeypatch):
+    # Alpaca bars are stamped at midnight ET in UTC; Alpha Vantage returns naive dates
+    frames = {
+        "AAPL": pd.DataFrame({"close": [1.0, 2.0, 3.0]}, index=pd.DatetimeIndex(["2024-01-02T05:00:00Z", "2024-01-03T05:00:00Z", "2024-01-04T05:00:00Z"], name="Date")),
+        "MSFT": pd.DataFrame({"close": [10.0, 11.0, 12.0]}, index=pd.DatetimeIndex(["2024-01-02", "2024-01-03", "2024-01-04"], name="Date")),
+        "NVDA": pd.DataFrame(),
+    }
+    monkeypatch.setattr(tools.api, "get_price_data", lambda ticker, start, end: frames[ticker])
+
+    engine = QuantEngine(list(frames), "2024-01-01", "2024-01-05")
+    wide = asyncio.run(engine._get_prices_wide(asyncio.Semaphore(4)))
+
+    assert list(wide.columns) == ["AAPL", "MSFT"]
+    assert wide.index.tz is None
+    assert list(wide.index) == list(pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"]))
+    assert not wide.isna().any().any()
@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 from screener.engine import run_screener
 from screener.eligibility import filter_eligible, EligibilityConfig
 from screener.ranker import rank_cross_section, compute_composite_score
@@ -54,6 +55,66 @@ def test_factor_directionality():
     # STABLE should have higher composite score because lower vol is better
     assert composite["STABLE"] > composite["VOLATILE"]
 
+def test_numba_ranker_matches_numpy():
+    import numpy as np
+    from screener import ranker
+    from screener._numba_ranker import winsor_zscore
+
+    if winsor_zscore is None:
+        pytest.skip("numba is not installed")
+
+    rng = np.random.default_rng(7)
+    arr = rng.normal(size=(ranker._NUMBA_MIN_ROWS + 500, 4))
+    arr[rng.random(arr.shape) < 0.05] = np.nan
+    arr[:, 2] = 0.5  # constant factor -> 0
+    arr[1:, 3] = np.nan  # single-value factor -> 0
+
+    expected = pd.DataFrame(arr).apply(lambda col: ranker.zscore(ranker.winsorize(col.dropna())).reindex(col.index).fillna(0.0))
+    np.testing.assert_allclose(winsor_zscore(arr, 0.01, 0.99), expected.to_numpy(), rtol=0, atol=1e-12)
+
+def test_incremental_ranker_window():
+    import numpy as np
+    from screener.incremental_ranker import IncrementalCrossSectionRanker
+
+    rng = np.random.default_rng(11)
+    days = []
+    for _ in range(5):
+        arr = rng.normal(size=(300, 3))
+        arr[rng.random(arr.shape) < 0.05] = np.nan
+        arr[:, 2] = np.nan  # empty factor -> 0
+        days.append(pd.DataFrame(arr, columns=["momentum_12_1", "volatility_20d", "value"]))
+
+    # window=1 is exactly the cross-sectional ranking of the latest day
+    single = IncrementalCrossSectionRanker(window=1)
+    for day in days:
+        single.update(day)
+    np.testing.assert_allclose(single.snapshot().to_numpy(), rank_cross_section(days[-1]).to_numpy(), rtol=0, atol=1e-12)
+
+    # Pooled moments equal those of the concatenated (per-day winsorized) window
+    pooled = IncrementalCrossSectionRanker(window=3)
+    for day in days:
+        pooled.update(day)
+    clipped = [day.clip(day.quantile(0.01), day.quantile(0.99), axis=1) for day in days[-3:]]
+    window = pd.concat(clipped)
+    count, mean, m2, _, _ = pooled._pooled()
+    np.testing.assert_allclose(mean[:2], window.mean().to_numpy()[:2], rtol=1e-12)
+    np.testing.assert_allclose(np.sqrt(m2[:2] / (count[:2] - 1)), window.std().to_numpy()[:2], rtol=1e-12)
+    assert (pooled.snapshot()["value"] == 0).all()
+
+def test_rank_cross_section_by_sector():
+    import numpy as np
+
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame(rng.normal(size=(90, 2)), columns=["momentum_12_1", "volatility_20d"])
+    df["sector"] = rng.choice(["Tech", "Energy", "Health"], size=len(df))
+
+    ranked = rank_cross_section(df, group_col="sector")
+
+    assert list(ranked.columns) == ["momentum_12_1", "volatility_20d"]
+    for _, bucket in df.groupby("sector"):
+        expected = rank_cross_section(bucket.drop(columns=["sector"]))
+        pd.testing.assert_frame_equal(ranked.loc[bucket.index], expected)
+
 def test_screener_persistence():
     from database.connection import SessionLocal, engine
     from database.models import ScreenerRun, Base
@@ -79,17 +79,7 @@ class MarketDataClient:
         return {"error": "Alpaca not configured"}
 
     def prices_to_df(self, prices: List[Price]) -> pd.DataFrame:
-        if not prices:
-            return pd.DataFrame()
-        df = pd.DataFrame([p.model_dump() for p in prices])
-        df["Date"] = pd.to_datetime(df["time"])
-        df.set_index("Date", inplace=True)
-        numeric_cols = ["open", "close", "high", "low", "volume"]
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-        df.sort_index(inplace=True)
-        return df
+        return self.av_service.prices_to_df(prices)
 
 
 # Singleton instance
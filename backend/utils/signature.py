@@ -1,28 +1,34 @@
+import functools
 import inspect
 import logging
-from typing import Any, Dict, Type
+from typing import Any, Dict, FrozenSet, Optional, Type
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=None)
+def _accepted_params(cls: Type) -> Optional[FrozenSet[str]]:
+    """Constructor parameter names of `cls`, or None if it accepts arbitrary **kwargs."""
+    parameters = inspect.signature(cls.__init__).parameters
+    if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+        return None
+    return frozenset(parameters)
+
 def validate_and_filter_kwargs(cls: Type, kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """
     Introspects a class constructor and filters kwargs to match its signature.
     Prevents runtime crashes due to library version drift.
     """
-    signature = inspect.signature(cls.__init__)
-    parameters = signature.parameters
-    
-    # Check if the class accepts arbitrary kwargs (**kwargs)
-    has_var_kwargs = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values())
+    accepted = _accepted_params(cls)
     
-    if has_var_kwargs:
+    # The class accepts arbitrary kwargs (**kwargs)
+    if accepted is None:
         return kwargs
 
     filtered_kwargs = {}
     dropped_args = []
     
     for key, value in kwargs.items():
-        if key in parameters:
+        if key in accepted:
             filtered_kwargs[key] = value
         else:
             dropped_args.append(key)